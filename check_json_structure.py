@@ -63,11 +63,11 @@ def check_json_structure(database_url: str, table_name: str = 'public_marts.cand
 
                 if isinstance(first_item, dict):
                     print("📋 Keys in first item:")
-                    for key, value in first_item.items():
-                        if isinstance(value, str) and len(value) < 100:
-                            print(f"   '{key}': '{value}'")
-                        else:
-                            print(f"   '{key}': {type(value).__name__} (length: {len(str(value)) if value else 0})")
+                    print("\n".join(
+                        f"   '{key}': '{value}'" if isinstance(value, str) and len(value) < 100
+                        else f"   '{key}': {type(value).__name__} (length: {len(str(value)) if value else 0})"
+                        for key, value in first_item.items()
+                    ))
 
                     # Check if any keys look like field titles
                     print("\n🔍 Potential field titles found:")
@@ -80,11 +80,11 @@ def check_json_structure(database_url: str, table_name: str = 'public_marts.cand
             elif isinstance(json_data, dict):
                 print("✅ JSON is an object")
                 print("📋 Keys found:")
-                for key, value in json_data.items():
-                    if isinstance(value, str) and len(value) < 100:
-                        print(f"   '{key}': '{value}'")
-                    else:
-                        print(f"   '{key}': {type(value).__name__}")
+                print("\n".join(
+                    f"   '{key}': '{value}'" if isinstance(value, str) and len(value) < 100
+                    else f"   '{key}': {type(value).__name__}"
+                    for key, value in json_data.items()
+                ))
 
             else:
                 print(f"❌ Unexpected JSON type: {type(json_data)}")
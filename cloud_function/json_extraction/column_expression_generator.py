@@ -7,13 +7,50 @@ COALESCE expressions that match the original system's extraction logic.
 """
 
 import re
-from typing import List
-from .strategies.base_strategy import JsonExtractionContext, IJsonExtractionStrategy
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from .strategies.base_strategy import JsonExtractionContext, IJsonExtractionStrategy, _SQL_ESCAPE_TABLE
 from .strategies.nested_list_strategy import NestedListExtractionStrategy
 from .strategies.direct_field_strategy import DirectFieldExtractionStrategy
 from .strategies.flexible_array_strategy import FlexibleArrayExtractionStrategy
 from .strategies.direct_string_strategy import DirectStringValueExtractionStrategy
 from .strategies.wildcard_search_strategy import WildcardSearchExtractionStrategy
+from .strategies.jsonpath_strategy import JsonPathListExtractionStrategy
+
+
+# One pass over the title: each whitespace run, and each other non-word character,
+# becomes a single underscore (same result as the former two-substitution version)
+_UNSAFE_CHARS_RE = re.compile(r'\s+|[^\w\s]')
+
+# Upper bound on memoized column expressions per generator (entries are a few KB each)
+_EXPRESSION_CACHE_SIZE = 4096
+
+# Stand-in pattern for rendering PATTERN_ONLY strategies once per JSON column
+# (a NUL byte cannot occur in the SQL text the strategies produce)
+_PATTERN_PLACEHOLDER = "\x00pattern\x00"
+
+
+@lru_cache(maxsize=1024)
+def _sql_pattern(field_title: str) -> str:
+    """Truncate field title to 30 characters and escape single quotes (memoized)"""
+    return field_title[:30].translate(_SQL_ESCAPE_TABLE)
+
+
+@lru_cache(maxsize=1024)
+def _safe_column_name(field_title: str, index: int) -> str:
+    """Convert field title to a safe PostgreSQL column name (memoized)"""
+    # Replace problematic characters
+    safe_name = _UNSAFE_CHARS_RE.sub('_', field_title).strip('_').lower()
+    
+    # Ensure it's not too long (PostgreSQL limit is 63 characters)
+    if len(safe_name) > 50:
+        safe_name = safe_name[:47] + f"_{index}"
+    
+    # Ensure it doesn't start with a number
+    if safe_name and safe_name[0].isdigit():
+        safe_name = f"field_{safe_name}"
+    
+    return safe_name or f"field_{index}"
 
 
 class ColumnExpressionGenerator:
@@ -28,15 +65,76 @@ class ColumnExpressionGenerator:
     5. WildcardSearchExtractionStrategy (Try 5: wildcard search)
     """
     
-    def __init__(self):
-        """Initialize with all 5 strategies in the correct order"""
-        self.strategies: List[IJsonExtractionStrategy] = [
-            NestedListExtractionStrategy(),      # Strategy 1
+    def __init__(self, use_jsonpath: bool = False):
+        """
+        Initialize with all 5 strategies in the correct order.
+        
+        Args:
+            use_jsonpath: Use a single jsonb_path_query_first() lookup for Strategy 1
+                instead of jsonb_array_elements() (requires PostgreSQL 12+)
+        """
+        nested_list_strategy = (
+            JsonPathListExtractionStrategy() if use_jsonpath else NestedListExtractionStrategy()
+        )
+        self._strategies: Tuple[IJsonExtractionStrategy, ...] = (
+            nested_list_strategy,                # Strategy 1
             DirectFieldExtractionStrategy(),     # Strategy 2 (disabled)
             FlexibleArrayExtractionStrategy(),   # Strategy 3
             DirectStringValueExtractionStrategy(), # Strategy 4
             WildcardSearchExtractionStrategy()   # Strategy 5
-        ]
+        )
+        
+        # Bumped on every change to the strategy chain; all caches below are keyed on it
+        self._strategies_version = 0
+        
+        # Applicability of field-independent strategies, cached per JSON column
+        self._applicability_cache: Dict[tuple, Tuple[Optional[bool], ...]] = {}
+        
+        # Finished column expressions; re-running a report reuses them verbatim
+        self._expression_cache: Dict[tuple, str] = {}
+        
+        # COALESCE text per JSON column with _PATTERN_PLACEHOLDER in place of the
+        # pattern, or None when a strategy needs more of the field than its pattern
+        self._coalesce_template_cache: Dict[tuple, Optional[str]] = {}
+    
+    @property
+    def strategies(self) -> Tuple[IJsonExtractionStrategy, ...]:
+        """Strategies in COALESCE order (use add_strategy/remove_strategy to change them)"""
+        return self._strategies
+    
+    @strategies.setter
+    def strategies(self, strategies) -> None:
+        self._strategies = tuple(strategies)
+        self.invalidate_caches()
+    
+    @property
+    def strategies_version(self) -> int:
+        """Counter that changes whenever the strategy chain changes"""
+        return self._strategies_version
+    
+    def add_strategy(self, strategy: IJsonExtractionStrategy) -> None:
+        """Append a strategy to the end of the chain"""
+        self._strategies += (strategy,)
+        self.invalidate_caches()
+    
+    def remove_strategy(self, strategy: IJsonExtractionStrategy) -> None:
+        """Remove a strategy from the chain (ValueError if it is not in it)"""
+        strategies = list(self._strategies)
+        strategies.remove(strategy)
+        self._strategies = tuple(strategies)
+        self.invalidate_caches()
+    
+    def invalidate_caches(self) -> None:
+        """
+        Forget cached decisions, templates and expressions.
+        
+        Called by add_strategy/remove_strategy; call it directly after changing
+        a strategy in place (e.g. overriding its is_applicable).
+        """
+        self._strategies_version += 1
+        self._applicability_cache.clear()
+        self._expression_cache.clear()
+        self._coalesce_template_cache.clear()
     
     def generate_column_expression(self, 
                                   field_title: str, 
@@ -68,12 +166,29 @@ class ColumnExpressionGenerator:
             ) AS "safe_column_name"
             ```
         """
+        cache_key = (field_title, index, json_column, self._strategies_version)
+        expression = self._expression_cache.get(cache_key)
+        if expression is None:
+            if len(self._expression_cache) >= _EXPRESSION_CACHE_SIZE:
+                self._expression_cache.clear()
+            expression = self._build_column_expression(field_title, index, json_column)
+            self._expression_cache[cache_key] = expression
+        return expression
+    
+    def _build_column_expression(self, field_title: str, index: int, json_column: str) -> str:
+        """Build the COALESCE column expression for one field (uncached)"""
         # Create pattern (truncated to 30 chars, escaped for SQL)
         pattern = self._create_pattern(field_title)
         
         # Create safe column name
         safe_column_name = self._make_safe_column_name(field_title, index)
         
+        # Compiled once per JSON column: only the pattern is substituted per field
+        template = self._coalesce_template(json_column)
+        if template is not None:
+            coalesce_expr = template.replace(_PATTERN_PLACEHOLDER, pattern)
+            return f'{coalesce_expr} AS "{safe_column_name}"'
+        
         # Create extraction context
         context = JsonExtractionContext(
             json_column=json_column,
@@ -82,19 +197,88 @@ class ColumnExpressionGenerator:
             safe_column_name=safe_column_name
         )
         
+        coalesce_expr = self._build_coalesce(context, self._applicable_strategies(context))
+        return f'{coalesce_expr} AS "{safe_column_name}"'
+    
+    def _build_coalesce(self, context: JsonExtractionContext,
+                        strategies: List[IJsonExtractionStrategy]) -> str:
+        """Join the strategies' expressions into one COALESCE with '' as the final fallback"""
         # Generate expressions for all applicable strategies
-        strategy_expressions = []
-        for strategy in self.strategies:
-            if strategy.is_applicable(context):
-                expr = strategy.generate_sql_expression(context)
-                strategy_expressions.append(expr)
+        strategy_expressions = [strategy.generate_sql_expression(context) for strategy in strategies]
+        
+        # Build COALESCE with fallback to empty string: one join for the strategy
+        # bodies, one f-string for the wrapper
+        if strategy_expressions:
+            body = ",\n                ".join(strategy_expressions)
+            return f"COALESCE(\n                {body},\n                ''\n            )"
+        return "COALESCE(\n                ''\n            )"
+    
+    def _coalesce_template(self, json_column: str) -> Optional[str]:
+        """
+        Get the COALESCE expression for json_column with a placeholder pattern.
         
-        # Build COALESCE with fallback to empty string
-        coalesce_expr = "COALESCE(\n" + ",\n".join([
-            f"                {expr}" for expr in strategy_expressions
-        ]) + ",\n                ''\n            )"
+        Available only when every strategy is FIELD_INDEPENDENT and every applicable
+        one is PATTERN_ONLY, so the text differs between fields by the pattern alone.
         
-        return f'{coalesce_expr} AS "{safe_column_name}"'
+        Args:
+            json_column: Name of the JSON column
+            
+        Returns:
+            COALESCE text containing _PATTERN_PLACEHOLDER, or None
+        """
+        strategies = self._strategies
+        cache_key = (json_column, self._strategies_version)
+        if cache_key in self._coalesce_template_cache:
+            return self._coalesce_template_cache[cache_key]
+        
+        template = None
+        if all(strategy.FIELD_INDEPENDENT for strategy in strategies):
+            context = JsonExtractionContext(
+                json_column=json_column,
+                pattern=_PATTERN_PLACEHOLDER,
+                field_title=_PATTERN_PLACEHOLDER,
+                safe_column_name=_PATTERN_PLACEHOLDER
+            )
+            applicable = self._applicable_strategies(context)
+            if all(strategy.PATTERN_ONLY for strategy in applicable):
+                template = self._build_coalesce(context, applicable)
+        
+        self._coalesce_template_cache[cache_key] = template
+        return template
+    
+    def _applicable_strategies(self, context: JsonExtractionContext) -> List[IJsonExtractionStrategy]:
+        """
+        Get applicable strategies in order, reusing cached per-column decisions.
+        
+        Strategies marked FIELD_INDEPENDENT are asked once per JSON column;
+        the rest are still asked for every field. A strategy whose SHADOWED_BY
+        strategies all come before it is skipped, as it can never win the COALESCE.
+        
+        Args:
+            context: JsonExtractionContext for the field being generated
+            
+        Returns:
+            Applicable strategies in COALESCE order
+        """
+        strategies = self._strategies
+        cache_key = (context.json_column, self._strategies_version)
+        decisions = self._applicability_cache.get(cache_key)
+        if decisions is None:
+            decisions = tuple(
+                strategy.is_applicable(context) if strategy.FIELD_INDEPENDENT else None
+                for strategy in strategies
+            )
+            self._applicability_cache[cache_key] = decisions
+        
+        applicable_strategies = []
+        applicable_names = set()
+        for strategy, applicable in zip(strategies, decisions):
+            if applicable or (applicable is None and strategy.is_applicable(context)):
+                if strategy.SHADOWED_BY and applicable_names.issuperset(strategy.SHADOWED_BY):
+                    continue
+                applicable_strategies.append(strategy)
+                applicable_names.add(strategy.get_strategy_name())
+        return applicable_strategies
     
     def _create_pattern(self, field_title: str) -> str:
         """
@@ -107,8 +291,7 @@ class ColumnExpressionGenerator:
             Pattern truncated to 30 characters with escaped quotes
         """
         # Truncate to 30 characters and escape single quotes (original behavior)
-        pattern = field_title[:30].replace("'", "''")
-        return pattern
+        return _sql_pattern(field_title)
     
     def _make_safe_column_name(self, field_title: str, index: int) -> str:
         """
@@ -124,20 +307,8 @@ class ColumnExpressionGenerator:
         Returns:
             PostgreSQL-safe column name
         """
-        # Replace problematic characters
-        safe_name = re.sub(r'[^\w\s]', '_', field_title)
-        safe_name = re.sub(r'\s+', '_', safe_name)
-        safe_name = safe_name.strip('_').lower()
-        
-        # Ensure it's not too long (PostgreSQL limit is 63 characters)
-        if len(safe_name) > 50:
-            safe_name = safe_name[:47] + f"_{index}"
-        
-        # Ensure it doesn't start with a number
-        if safe_name and safe_name[0].isdigit():
-            safe_name = f"field_{safe_name}"
-        
-        return safe_name or f"field_{index}"
+        # Results are pure on (field_title, index), so repeated reports hit the cache
+        return _safe_column_name(field_title, index)
     
     def get_strategy_count(self) -> int:
         """Get total number of strategies available"""
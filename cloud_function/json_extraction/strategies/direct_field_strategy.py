@@ -8,7 +8,7 @@ Currently disabled in the original code but architecture ready for future implem
 Example: json_column->>'field_name'
 """
 
-from .base_strategy import BaseJsonExtractionStrategy, JsonExtractionContext
+from .base_strategy import BaseJsonExtractionStrategy, JsonExtractionContext, _SQL_ESCAPE_TABLE
 
 
 class DirectFieldExtractionStrategy(BaseJsonExtractionStrategy):
@@ -28,6 +28,8 @@ class DirectFieldExtractionStrategy(BaseJsonExtractionStrategy):
     the same COALESCE structure as the original code.
     """
     
+    FIELD_INDEPENDENT = True
+    
     def generate_sql_expression(self, context: JsonExtractionContext) -> str:
         """
         Generate SQL expression for direct field access.
@@ -88,5 +90,5 @@ class DirectFieldExtractionStrategy(BaseJsonExtractionStrategy):
             SQL expression for direct field access
         """
         # Safe column name cleaning for JSON key access
-        clean_field_name = context.field_title.replace("'", "''")
-        return f"{context.json_column}->'>'{clean_field_name}'"
+        clean_field_name = context.field_title.translate(_SQL_ESCAPE_TABLE)
+        return f"{context.json_column}->>'{clean_field_name}'"
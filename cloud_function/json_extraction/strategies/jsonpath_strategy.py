@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+JSONPath Nested List Extraction Strategy
+
+Alternative to Strategy 1 for PostgreSQL 12+: finds the matching element of the
+nested 'list' array with a single jsonb_path_query_first() call instead of
+unnesting the array with jsonb_array_elements() and filtering the rows.
+"""
+
+from .base_strategy import BaseJsonExtractionStrategy, JsonExtractionContext
+
+
+# Backslashes and double quotes must be escaped inside a jsonpath string literal
+_JSONPATH_ESCAPE_TABLE = str.maketrans({'\\': '\\\\', '"': '\\"'})
+
+# Characters with a special meaning in like_regex patterns
+_REGEX_SPECIAL = frozenset('.^$*+?()[]{}|\\')
+
+
+def _like_to_regex(pattern: str) -> str:
+    """
+    Translate an ILIKE pattern body into an equivalent like_regex pattern.
+
+    % and _ become .* and . as in ILIKE, a backslash makes the next character
+    literal (ILIKE's default escape), and every other character matches itself.
+    """
+    parts = []
+    chars = iter(pattern)
+    for char in chars:
+        if char == '%':
+            parts.append('.*')
+        elif char == '_':
+            parts.append('.')
+        else:
+            if char == '\\':
+                char = next(chars, '\\')
+            parts.append('\\' + char if char in _REGEX_SPECIAL else char)
+    return ''.join(parts)
+
+
+class JsonPathListExtractionStrategy(BaseJsonExtractionStrategy):
+    """
+    Extracts values from the nested 'list' array with one JSONPath traversal.
+
+    Matching is the same case-insensitive substring search as the ILIKE
+    '%pattern%' conditions of the other strategies: the pattern is translated
+    to a regex in which % and _ are still wildcards and everything else is
+    literal, matched with flags "i" (case-insensitive) and "s" (so . and .*
+    span newlines like %). Unlike ->> with ILIKE, like_regex only matches
+    string values, so a numeric or boolean title never matches here.
+
+    The path runs in strict mode behind a jsonb_typeof() guard, so only a
+    'list' key holding an array is searched: lax mode would also wrap an
+    object-valued 'list' and unwrap a top-level array, matching elements
+    that the jsonb_array_elements version never looks at.
+
+    SQL Pattern Generated:
+    ```sql
+    (
+        SELECT COALESCE(item->>'value_text', item->>'answer', ..., '')
+        FROM (
+            SELECT CASE
+                WHEN jsonb_typeof(json_column->'list') = 'array'
+                THEN jsonb_path_query_first(
+                    json_column,
+                    'strict $.list[*] ? (@."question_title" like_regex "pattern" flag "is"
+                                         || @."title" like_regex "pattern" flag "is" || ...)'
+                )
+            END AS item
+        ) matched
+        WHERE item IS NOT NULL
+    )
+    ```
+    """
+
+    FIELD_INDEPENDENT = True
+
+    def generate_sql_expression(self, context: JsonExtractionContext) -> str:
+        """
+        Generate SQL expression for JSONPath nested list extraction.
+
+        Args:
+            context: JsonExtractionContext with extraction parameters
+
+        Returns:
+            SQL subquery that is NULL when no list element matches, so the
+            COALESCE chain falls through to the next strategy
+        """
+        col = context.json_column
+        literal = _like_to_regex(context.pattern).translate(_JSONPATH_ESCAPE_TABLE)
+
+        value_coalesce = self._build_value_coalesce(context.value_keys, "item")
+        predicate = " || ".join(
+            f'@."{key}" like_regex "{literal}" flag "is"' for key in context.match_keys
+        )
+
+        sql_expression = f"""
+        (
+            SELECT {value_coalesce}
+            FROM (
+                SELECT CASE
+                    WHEN jsonb_typeof({col}->'list') = 'array'
+                    THEN jsonb_path_query_first({col}, 'strict $.list[*] ? ({predicate})')
+                END AS item
+            ) matched
+            WHERE item IS NOT NULL
+        )"""
+
+        return sql_expression.strip()
+
+    def get_strategy_name(self) -> str:
+        """Get human-readable strategy name"""
+        return "JsonPathListExtraction"
+
+    def is_applicable(self, context: JsonExtractionContext) -> bool:
+        """
+        Always applicable - it stands in for Strategy 1 when enabled.
+
+        Args:
+            context: JsonExtractionContext (not used for this strategy)
+
+        Returns:
+            Always True
+        """
+        return True
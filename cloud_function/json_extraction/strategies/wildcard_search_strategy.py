@@ -9,6 +9,10 @@ anywhere in the JSON structure. Corresponds to "Try 5" in the original code.
 from .base_strategy import BaseJsonExtractionStrategy, JsonExtractionContext
 
 
+# Minimal value keys for the final fallback
+_VALUE_KEYS = ("value_text", "value", "text", "answer")
+
+
 class WildcardSearchExtractionStrategy(BaseJsonExtractionStrategy):
     """
     Wildcard search extraction strategy.
@@ -37,16 +41,23 @@ class WildcardSearchExtractionStrategy(BaseJsonExtractionStrategy):
                 ELSE jsonb_build_array(json_column)
             END
         ) value
-        WHERE LOWER(value->>0)::text LIKE LOWER('%pattern%')
-           OR LOWER(value->>'question_title')::text LIKE LOWER('%pattern%')
-           OR LOWER(value->>'title')::text LIKE LOWER('%pattern%')
-           OR LOWER(value->>'question')::text LIKE LOWER('%pattern%')
-           OR LOWER(value->>'name')::text LIKE LOWER('%pattern%')
+        WHERE value->>0 ILIKE '%pattern%'
+           OR value->>'question_title' ILIKE '%pattern%'
+           OR value->>'title' ILIKE '%pattern%'
+           OR value->>'question' ILIKE '%pattern%'
+           OR value->>'name' ILIKE '%pattern%'
         LIMIT 1
     )
     ```
     """
     
+    FIELD_INDEPENDENT = True
+    PATTERN_ONLY = True
+    
+    # value->>0 is Strategy 4's condition and the named keys are a subset of
+    # Strategy 3's, over the same array elements
+    SHADOWED_BY = ("FlexibleArrayMatching", "DirectStringValue")
+    
     def generate_sql_expression(self, context: JsonExtractionContext) -> str:
         """
         Generate SQL expression for wildcard search.
@@ -57,18 +68,18 @@ class WildcardSearchExtractionStrategy(BaseJsonExtractionStrategy):
         Returns:
             SQL subquery that performs comprehensive wildcard search
         """
-        # Minimal value keys for final fallback
-        value_keys = ["value_text", "value", "text", "answer"]
+        col = context.json_column
+        pattern = context.pattern
         
         # Build value COALESCE
-        value_coalesce = self._build_value_coalesce(value_keys, "value")
+        value_coalesce = self._build_value_coalesce(_VALUE_KEYS, "value")
         
         # Build comprehensive WHERE conditions (both direct and named field matching)
-        where_conditions = f"""LOWER(value->>0)::text LIKE LOWER('%{context.pattern}%')
-               OR LOWER(value->>'question_title')::text LIKE LOWER('%{context.pattern}%')
-               OR LOWER(value->>'title')::text LIKE LOWER('%{context.pattern}%')
-               OR LOWER(value->>'question')::text LIKE LOWER('%{context.pattern}%')
-               OR LOWER(value->>'name')::text LIKE LOWER('%{context.pattern}%')"""
+        where_conditions = f"""value->>0 ILIKE '%{pattern}%'
+               OR value->>'question_title' ILIKE '%{pattern}%'
+               OR value->>'title' ILIKE '%{pattern}%'
+               OR value->>'question' ILIKE '%{pattern}%'
+               OR value->>'name' ILIKE '%{pattern}%'"""
         
         # Generate the complete SQL expression
         sql_expression = f"""
@@ -76,9 +87,9 @@ class WildcardSearchExtractionStrategy(BaseJsonExtractionStrategy):
             SELECT {value_coalesce}
             FROM jsonb_array_elements(
                 CASE
-                    WHEN jsonb_typeof({context.json_column}) = 'array'
-                    THEN {context.json_column}
-                    ELSE jsonb_build_array({context.json_column})
+                    WHEN jsonb_typeof({col}) = 'array'
+                    THEN {col}
+                    ELSE jsonb_build_array({col})
                 END
             ) value
             WHERE {where_conditions}
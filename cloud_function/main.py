@@ -4,6 +4,7 @@ import re
 import time
 import typing
 from datetime import datetime, timezone
+from itertools import islice
 from urllib.parse import urlparse, parse_qs
 
 import functions_framework
@@ -14,7 +15,7 @@ import psycopg
 from psycopg.rows import dict_row
 
 # Import JSON unnesting functionality
-from json_unnesting import process_query_with_json_unnesting
+from json_unnesting import iter_query_with_json_unnesting
 
 
 def _iso_now() -> str:
@@ -255,12 +256,19 @@ def pg_query_output_to_gsheet(request):
 		status_cell = args.get("status_cell")
 		value_input_option = args.get("value_input_option", "RAW")
 		include_headers = (args.get("include_headers", "true").lower() != "false")
-		row_limit = int(args.get("row_limit", os.getenv("DEFAULT_ROW_LIMIT", "50000")))
+		row_limit_arg = args.get("row_limit", os.getenv("DEFAULT_ROW_LIMIT", "50000"))
 		token = args.get("token")
 
 		if not spreadsheet_id:
 			return ("Missing required param: spreadsheet_id", 400)
 
+		try:
+			row_limit = int(row_limit_arg)
+		except ValueError:
+			row_limit = -1
+		if row_limit < 0:
+			return ("row_limit must be a non-negative integer", 400)
+
 		# Auth check if configured
 		_require_token_if_configured(token)
 
@@ -296,14 +304,20 @@ def pg_query_output_to_gsheet(request):
 
 		# Try to use JSON unnesting functionality first
 		try:
-			rows = process_query_with_json_unnesting(query_sql, database_url)
 			# Apply row limit to results if needed
 			# Check if original SQL already has LIMIT (after stripping template syntax)
 			clean_sql = _strip_template_syntax(query_sql)
 			has_existing_limit = bool(re.search(r"\bLIMIT\b", clean_sql, flags=re.IGNORECASE))
 
-			if not has_existing_limit and row_limit != float('inf') and len(rows) > row_limit:
-				rows = rows[:row_limit]
+			row_iter = iter_query_with_json_unnesting(query_sql, database_url)
+			try:
+				if not has_existing_limit and row_limit != float('inf'):
+					# Stop reading the streamed result once the limit is reached
+					rows = list(islice(row_iter, row_limit))
+				else:
+					rows = list(row_iter)
+			finally:
+				row_iter.close()
 		except ImportError:
 			# Fall back to direct execution if JSON unnesting is not available
 			conn = psycopg.connect(database_url, connect_timeout=15, row_factory=dict_row)
@@ -317,14 +331,8 @@ def pg_query_output_to_gsheet(request):
 					rows = cur.fetchall()
 			finally:
 				conn.close()
-
-		# Apply row limit to results if needed
-		# Check if original SQL already has LIMIT (after stripping template syntax)
-		clean_sql = _strip_template_syntax(query_sql)
-		has_existing_limit = bool(re.search(r"\bLIMIT\b", clean_sql, flags=re.IGNORECASE))
-
-		if not has_existing_limit and row_limit != float('inf') and len(rows) > row_limit:
-			rows = rows[:row_limit]
+			if not has_existing_limit:
+				rows = rows[:row_limit]
 
 		values = _to_sheet_values(rows, include_headers=include_headers)
 
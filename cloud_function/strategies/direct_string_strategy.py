@@ -9,6 +9,10 @@ Corresponds to "Try 4" in the original code.
 from .base_strategy import BaseJsonExtractionStrategy, JsonExtractionContext
 
 
+# Value keys for this strategy (subset of the extended keys)
+_VALUE_KEYS = ("value_text", "value", "text", "answer", "response")
+
+
 class DirectStringValueExtractionStrategy(BaseJsonExtractionStrategy):
     """
     Direct string value extraction strategy.
@@ -35,12 +39,15 @@ class DirectStringValueExtractionStrategy(BaseJsonExtractionStrategy):
                 ELSE jsonb_build_array(json_column)
             END
         ) elem
-        WHERE LOWER(elem->>0)::text LIKE LOWER('%pattern%')
+        WHERE elem->>0 ILIKE '%pattern%'
         LIMIT 1
     )
     ```
     """
     
+    FIELD_INDEPENDENT = True
+    PATTERN_ONLY = True
+    
     def generate_sql_expression(self, context: JsonExtractionContext) -> str:
         """
         Generate SQL expression for direct string value extraction.
@@ -51,11 +58,11 @@ class DirectStringValueExtractionStrategy(BaseJsonExtractionStrategy):
         Returns:
             SQL subquery that looks for direct string values at index 0
         """
-        # Value keys for this strategy (subset of extended keys)
-        value_keys = ["value_text", "value", "text", "answer", "response"]
+        col = context.json_column
+        pattern = context.pattern
         
         # Build value COALESCE
-        value_coalesce = self._build_value_coalesce(value_keys, "elem")
+        value_coalesce = self._build_value_coalesce(_VALUE_KEYS, "elem")
         
         # Generate the complete SQL expression
         sql_expression = f"""
@@ -63,12 +70,12 @@ class DirectStringValueExtractionStrategy(BaseJsonExtractionStrategy):
             SELECT {value_coalesce}
             FROM jsonb_array_elements(
                 CASE
-                    WHEN jsonb_typeof({context.json_column}) = 'array'
-                    THEN {context.json_column}
-                    ELSE jsonb_build_array({context.json_column})
+                    WHEN jsonb_typeof({col}) = 'array'
+                    THEN {col}
+                    ELSE jsonb_build_array({col})
                 END
             ) elem
-            WHERE LOWER(elem->>0)::text LIKE LOWER('%{context.pattern}%')
+            WHERE elem->>0 ILIKE '%{pattern}%'
             LIMIT 1
         )"""
         
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """Debug the SQL transformation that's causing the function to fail"""
 
+import re
+import sys
+
 from json_unnesting import JsonUnnestingParser, JsonUnnestingTransformer
 
 # Your exact query that's failing
@@ -30,14 +33,14 @@ try:
     print(f"Unnesting requests: {len(parse_result.get('unnesting_requests', []))}")
 except Exception as e:
     print(f"❌ Parsing failed: {e}")
-    exit(1)
+    sys.exit(1)
 
 try:
     transformed_sql = transformer.transform(test_query, parse_result.get("unnesting_requests", []))
     print("✅ Transformation successful")
 except Exception as e:
     print(f"❌ Transformation failed: {e}")
-    exit(1)
+    sys.exit(1)
 
 print("\n=== Checking SQL Syntax ===")
 print("Length of transformed SQL:", len(transformed_sql))
@@ -73,16 +76,12 @@ if single_quotes % 2 != 0:
     print("❌ Unbalanced single quotes detected!")
 
 # Look for the specific regex issue in our SELECT parsing
-try:
-    import re
-    select_match = re.search(r'SELECT\s+(.*?)\s+FROM', test_query, re.IGNORECASE | re.DOTALL)
-    if select_match:
-        original_select = select_match.group(1).strip()
-        print(f"\nOriginal SELECT content: {repr(original_select[:100])}")
-    else:
-        print("❌ Could not extract SELECT clause from original query")
-except Exception as e:
-    print(f"❌ Regex error: {e}")
+select_match = re.search(r'SELECT\s+(.*?)\s+FROM', test_query, re.IGNORECASE | re.DOTALL)
+if select_match:
+    original_select = select_match.group(1).strip()
+    print(f"\nOriginal SELECT content: {repr(original_select[:100])}")
+else:
+    print("❌ Could not extract SELECT clause from original query")
 
 print(f"\n=== First 500 chars of transformed SQL ===")
 print(transformed_sql[:500])
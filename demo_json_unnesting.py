@@ -16,10 +16,6 @@ FROM public_marts.candidates
 WHERE position_name ILIKE '%flutter%'
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(__file__))
-
 from cloud_function.json_unnesting import JsonUnnestingParser, JsonUnnestingTransformer
 
 def demo():
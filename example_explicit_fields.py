@@ -10,7 +10,13 @@ This demonstrates the explicit field approach:
 """
 
 import os
-from json_unnesting import process_query_with_json_unnesting
+from json_unnesting import process_query_with_json_unnesting, specialize_macro
+
+# Field titles used by the pre-rendered variant below
+SURVEY_FIELD_TITLES = (
+    "С какими аспектами управленческой отчётности есть опыт работы?",
+    "Ваш Telegram никнейм",
+)
 
 def main():
     # Example database URL - replace with your actual database connection
@@ -56,6 +62,23 @@ def main():
         print(f"Error: {e}")
         print("Make sure your database connection is configured correctly.")
 
+def show_specialized_macro_example():
+    """Show the pre-rendered variant for a fixed list of field titles"""
+    print("\n=== Pre-rendered Columns Variant ===")
+    
+    # Field titles are fixed for this survey, so the extraction columns can be
+    # generated once (and cached) instead of re-parsing the macro on every run
+    extracted_columns = specialize_macro("answers_json", "question_title", "value_text", *SURVEY_FIELD_TITLES)
+    
+    sql_template = '''
+    SELECT id, name,
+    {extracted_columns}
+    FROM survey_responses
+    '''
+    
+    print("Plain SQL equivalent to the macro in main():")
+    print(sql_template.replace("{extracted_columns}", extracted_columns))
+
 def show_transformation_example():
     """Show how the SQL transformation works"""
     print("\n=== SQL Transformation Example ===")
@@ -121,6 +144,7 @@ if __name__ == "__main__":
     # Test different parts of the functionality
     main()
     show_transformation_example()
+    show_specialized_macro_example()
     test_parser()
     
     print("\n" + "=" * 50)
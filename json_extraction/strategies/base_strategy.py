@@ -8,16 +8,26 @@ used in JSON field extraction from complex nested structures.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List
+from typing import Sequence, Tuple
 
 
-@dataclass
+# Doubles single quotes for SQL string literals in one C-level pass
+_SQL_ESCAPE_TABLE = str.maketrans({"'": "''"})
+
+
+# Default key sets, shared by every context that does not override them
+DEFAULT_VALUE_KEYS: Tuple[str, ...] = ("value_text", "answer", "text", "value", "response")
+DEFAULT_MATCH_KEYS: Tuple[str, ...] = ("question_title", "title", "question", "name")
+
+
+@dataclass(frozen=True, slots=True)
 class JsonExtractionContext:
     """
     Context object containing all parameters needed for JSON field extraction.
     
     This encapsulates the information each strategy needs to generate SQL expressions
-    for extracting specific fields from JSON columns.
+    for extracting specific fields from JSON columns. Contexts are immutable and
+    hashable, so they can be used as cache keys.
     """
     json_column: str        # Name of JSON column to extract from
     pattern: str           # Pattern to match (truncated, escaped field title)
@@ -25,15 +35,17 @@ class JsonExtractionContext:
     safe_column_name: str  # PostgreSQL-safe column name for output
     
     # Configurable key sets for flexibility
-    value_keys: List[str] = None    # Keys to look for field values
-    match_keys: List[str] = None    # Keys to match against pattern
+    value_keys: Tuple[str, ...] = DEFAULT_VALUE_KEYS    # Keys to look for field values
+    match_keys: Tuple[str, ...] = DEFAULT_MATCH_KEYS    # Keys to match against pattern
     
     def __post_init__(self):
-        """Set default key sets if not provided"""
-        if self.value_keys is None:
-            self.value_keys = ["value_text", "answer", "text", "value", "response"]
-        if self.match_keys is None:
-            self.match_keys = ["question_title", "title", "question", "name"]
+        """Store key sets as tuples (None selects the defaults) so the context stays hashable"""
+        if not isinstance(self.value_keys, tuple):
+            value_keys = DEFAULT_VALUE_KEYS if self.value_keys is None else tuple(self.value_keys)
+            object.__setattr__(self, "value_keys", value_keys)
+        if not isinstance(self.match_keys, tuple):
+            match_keys = DEFAULT_MATCH_KEYS if self.match_keys is None else tuple(self.match_keys)
+            object.__setattr__(self, "match_keys", match_keys)
 
 
 class IJsonExtractionStrategy(ABC):
@@ -45,6 +57,20 @@ class IJsonExtractionStrategy(ABC):
     sequence using COALESCE to provide fallback behavior.
     """
     
+    # True when is_applicable() only looks at context.json_column, which lets the
+    # coordinator cache the decision per JSON column instead of asking per field
+    FIELD_INDEPENDENT: bool = False
+    
+    # True when generate_sql_expression() depends on the field only through
+    # context.pattern, copied into the SQL unchanged; the coordinator then renders
+    # the expression once per JSON column and substitutes each field's pattern
+    PATTERN_ONLY: bool = False
+    
+    # Names of earlier strategies that together match every element this one
+    # can match; when all of them are applicable this strategy can never supply
+    # a value, so the coordinator leaves it out of the COALESCE
+    SHADOWED_BY: Tuple[str, ...] = ()
+    
     @abstractmethod
     def generate_sql_expression(self, context: JsonExtractionContext) -> str:
         """
@@ -61,7 +87,7 @@ class IJsonExtractionStrategy(ABC):
             (
                 SELECT COALESCE(item->>'value_text', item->>'answer', '')
                 FROM jsonb_array_elements(json_col->'list') item
-                WHERE LOWER(item->>'question_title') LIKE LOWER('%pattern%')
+                WHERE item->>'question_title' ILIKE '%pattern%'
                 LIMIT 1
             )
             ```
@@ -100,7 +126,7 @@ class BaseJsonExtractionStrategy(IJsonExtractionStrategy):
     need, reducing code duplication across concrete implementations.
     """
     
-    def _build_value_coalesce(self, value_keys: List[str], element_alias: str = "item") -> str:
+    def _build_value_coalesce(self, value_keys: Sequence[str], element_alias: str = "item") -> str:
         """
         Build COALESCE expression for extracting values from JSON elements.
         
@@ -120,7 +146,7 @@ class BaseJsonExtractionStrategy(IJsonExtractionStrategy):
         expressions.append("''")  # Fallback to empty string
         return f"COALESCE({', '.join(expressions)})"
     
-    def _build_match_conditions(self, match_keys: List[str], pattern: str, element_alias: str = "item") -> str:
+    def _build_match_conditions(self, match_keys: Sequence[str], pattern: str, element_alias: str = "item") -> str:
         """
         Build WHERE conditions for pattern matching against JSON keys.
         
@@ -134,16 +160,16 @@ class BaseJsonExtractionStrategy(IJsonExtractionStrategy):
             
         Example:
             ```sql
-            LOWER(item->>'question_title') LIKE LOWER('%pattern%')
-            OR LOWER(item->>'title') LIKE LOWER('%pattern%')
+            item->>'question_title' ILIKE '%pattern%'
+            OR item->>'title' ILIKE '%pattern%'
             ```
         """
         conditions = []
         for key in match_keys:
-            conditions.append(f"LOWER({element_alias}->>'{key}') LIKE LOWER('%{pattern}%')")
+            conditions.append(f"{element_alias}->>'{key}' ILIKE '%{pattern}%'")
         return "\n                       OR ".join(conditions)
     
-    def _build_extended_value_coalesce(self, extended_value_keys: List[str], element_alias: str = "elem") -> str:
+    def _build_extended_value_coalesce(self, extended_value_keys: Sequence[str], element_alias: str = "elem") -> str:
         """
         Build extended COALESCE for strategies that need more value key options.
         
@@ -156,7 +182,7 @@ class BaseJsonExtractionStrategy(IJsonExtractionStrategy):
         """
         return self._build_value_coalesce(extended_value_keys, element_alias)
     
-    def _build_extended_match_conditions(self, extended_match_keys: List[str], pattern: str, element_alias: str = "elem") -> str:
+    def _build_extended_match_conditions(self, extended_match_keys: Sequence[str], pattern: str, element_alias: str = "elem") -> str:
         """
         Build extended WHERE conditions for strategies that need more matching options.
         
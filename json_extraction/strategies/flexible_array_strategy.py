@@ -9,6 +9,11 @@ flexible field matching. This corresponds to "Try 3" in the original code.
 from .base_strategy import BaseJsonExtractionStrategy, JsonExtractionContext
 
 
+# Extended key sets for this strategy (more comprehensive than the context defaults)
+_VALUE_KEYS = ("value_text", "value", "text", "answer", "response", "description", "comment")
+_MATCH_KEYS = ("question_title", "title", "question", "name", "label", "key")
+
+
 class FlexibleArrayExtractionStrategy(BaseJsonExtractionStrategy):
     """
     Flexible array matching extraction strategy.
@@ -37,17 +42,20 @@ class FlexibleArrayExtractionStrategy(BaseJsonExtractionStrategy):
                 ELSE jsonb_build_array(json_column)
             END
         ) elem
-        WHERE LOWER(elem->>'question_title') LIKE LOWER('%pattern%')
-           OR LOWER(elem->>'title') LIKE LOWER('%pattern%')
-           OR LOWER(elem->>'question') LIKE LOWER('%pattern%')
-           OR LOWER(elem->>'name') LIKE LOWER('%pattern%')
-           OR LOWER(elem->>'label') LIKE LOWER('%pattern%')
-           OR LOWER(elem->>'key') LIKE LOWER('%pattern%')
+        WHERE elem->>'question_title' ILIKE '%pattern%'
+           OR elem->>'title' ILIKE '%pattern%'
+           OR elem->>'question' ILIKE '%pattern%'
+           OR elem->>'name' ILIKE '%pattern%'
+           OR elem->>'label' ILIKE '%pattern%'
+           OR elem->>'key' ILIKE '%pattern%'
         LIMIT 1
     )
     ```
     """
     
+    FIELD_INDEPENDENT = True
+    PATTERN_ONLY = True
+    
     def generate_sql_expression(self, context: JsonExtractionContext) -> str:
         """
         Generate SQL expression for flexible array matching.
@@ -58,20 +66,11 @@ class FlexibleArrayExtractionStrategy(BaseJsonExtractionStrategy):
         Returns:
             SQL subquery for flexible array element matching
         """
-        # Extended value keys for this strategy (more comprehensive than basic strategy)
-        extended_value_keys = [
-            "value_text", "value", "text", "answer", "response", 
-            "description", "comment"
-        ]
-        
-        # Extended match keys for this strategy
-        extended_match_keys = [
-            "question_title", "title", "question", "name", "label", "key"
-        ]
+        col = context.json_column
         
         # Build extended COALESCE and match conditions
-        value_coalesce = self._build_extended_value_coalesce(extended_value_keys, "elem")
-        match_conditions = self._build_extended_match_conditions(extended_match_keys, context.pattern, "elem")
+        value_coalesce = self._build_extended_value_coalesce(_VALUE_KEYS, "elem")
+        match_conditions = self._build_extended_match_conditions(_MATCH_KEYS, context.pattern, "elem")
         
         # Generate the complete SQL expression
         sql_expression = f"""
@@ -79,9 +78,9 @@ class FlexibleArrayExtractionStrategy(BaseJsonExtractionStrategy):
             SELECT {value_coalesce}
             FROM jsonb_array_elements(
                 CASE
-                    WHEN jsonb_typeof({context.json_column}) = 'array'
-                    THEN {context.json_column}
-                    ELSE jsonb_build_array({context.json_column})
+                    WHEN jsonb_typeof({col}) = 'array'
+                    THEN {col}
+                    ELSE jsonb_build_array({col})
                 END
             ) elem
             WHERE {match_conditions}
@@ -40,15 +40,18 @@ class NestedListExtractionStrategy(BaseJsonExtractionStrategy):
                 ELSE '[]'::jsonb
             END
         ) item
-        WHERE LOWER(item->>'question_title') LIKE LOWER('%pattern%')
-           OR LOWER(item->>'title') LIKE LOWER('%pattern%')
-           OR LOWER(item->>'question') LIKE LOWER('%pattern%')
-           OR LOWER(item->>'name') LIKE LOWER('%pattern%')
+        WHERE item->>'question_title' ILIKE '%pattern%'
+           OR item->>'title' ILIKE '%pattern%'
+           OR item->>'question' ILIKE '%pattern%'
+           OR item->>'name' ILIKE '%pattern%'
         LIMIT 1
     )
     ```
     """
     
+    FIELD_INDEPENDENT = True
+    PATTERN_ONLY = True
+    
     def generate_sql_expression(self, context: JsonExtractionContext) -> str:
         """
         Generate SQL expression for nested list extraction.
@@ -59,6 +62,8 @@ class NestedListExtractionStrategy(BaseJsonExtractionStrategy):
         Returns:
             SQL subquery that extracts from nested 'list' array
         """
+        col = context.json_column
+        
         # Build value COALESCE using context's value keys
         value_coalesce = self._build_value_coalesce(context.value_keys, "item")
         
@@ -71,8 +76,8 @@ class NestedListExtractionStrategy(BaseJsonExtractionStrategy):
             SELECT {value_coalesce}
             FROM jsonb_array_elements(
                 CASE
-                    WHEN {context.json_column} ? 'list' AND jsonb_typeof({context.json_column}->'list') = 'array'
-                    THEN {context.json_column}->'list'
+                    WHEN {col} ? 'list' AND jsonb_typeof({col}->'list') = 'array'
+                    THEN {col}->'list'
                     ELSE '[]'::jsonb
                 END
             ) item
@@ -1,31 +1,131 @@
+#!/usr/bin/env python3
+"""
+JSON Unnesting Module - Strategy Pattern Implementation
+
+Parses the {{fields_as_columns_from(...)}} custom syntax and rewrites the query
+so each requested field becomes a column. Column expressions are built by the
+strategy-based ColumnExpressionGenerator from the json_extraction package.
+
+This is the single implementation: json_unnesting_refactored re-exports it,
+and cloud_function/json_unnesting.py is a verbatim copy for deployment.
+"""
+
 import re
-from typing import List, Dict, Any, Set
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Iterator, List, Dict, Any, Optional, Set, Tuple
 import logging
-import json
 
-try:
-    import psycopg
-    from psycopg.rows import dict_row
-    HAS_PSYCOPG = True
-except ImportError:
-    psycopg = None
-    dict_row = None
-    HAS_PSYCOPG = False
+# Import the new strategy-based architecture
+from json_extraction import ColumnExpressionGenerator
+from json_extraction.strategies.base_strategy import DEFAULT_MATCH_KEYS, DEFAULT_VALUE_KEYS
+
+# The database driver is only needed to execute queries, so psycopg (and its C
+# extension) is imported by _load_psycopg() on the first query rather than here;
+# parse/transform-only callers never pay for it
+HAS_PSYCOPG = find_spec("psycopg") is not None
+HAS_PSYCOPG_POOL = find_spec("psycopg_pool") is not None
+psycopg = None
+dict_row = None
+ConnectionPool = None
 
 logger = logging.getLogger(__name__)
 
-# Removed the complex FieldDiscovery class - now using explicit field lists instead
+# Rows fetched per round trip when streaming query results from a server-side cursor
+_STREAM_BATCH_SIZE = 2000
+
+# Per-query guardrail; SET LOCAL lasts until the end of the query's transaction
+_QUERY_SETUP_SQL = "SET LOCAL statement_timeout = '60s'"
+# A direct connection serves a single query, so it is made read-only for that
+# transaction in the same round trip as the timeout (parameterless statements
+# may be sent together in one execute)
+_DIRECT_QUERY_SETUP_SQL = "SET TRANSACTION READ ONLY; " + _QUERY_SETUP_SQL
+
+# Warm connections kept per database URL when psycopg_pool is installed
+_POOL_MAX_SIZE = 4
+# Neon suspends idle compute (after 5 minutes by default) and drops its
+# connections, so idle pooled connections are closed before that happens
+# (the pool only shrinks down to min_size, hence min_size=0 below)
+_POOL_MAX_IDLE = 240
+_POOLS: Dict[str, Any] = {}
+
+# Doubles single quotes for SQL string literals in one C-level pass
+_SQL_ESCAPE_TABLE = str.maketrans({"'": "''"})
+
+# Reports are refreshed with the same SQL over and over, so _transform_query
+# keeps the rewritten text per query
+_TRANSFORM_CACHE_SIZE = 256
+
+# Keys every parsed unnesting request must carry (checked as one subset test)
+_REQUIRED_KEYS = frozenset(("json_column", "name_key", "value_key", "field_titles"))
+
+# Literal every template starts with; a plain substring test rules out ordinary
+# queries before any regex runs
+_TEMPLATE_MARKER = '{{fields_as_columns_from('
+
+# Precompiled patterns for the custom syntax and the clauses the transformer extracts
+_CUSTOM_SYNTAX_RE = re.compile(r'\{\{fields_as_columns_from\(([^,]+),\s*([^,]+),\s*([^,]+),\s*(.+)\)\}\}', re.DOTALL)
+_TEMPLATE_RE = re.compile(r'\{\{fields_as_columns_from\([^}]+\)\}\}')
+# FROM table and WHERE keyword found in one left-to-right pass; template spans are
+# consumed whole so keywords inside quoted field titles are never picked up
+_SCAN_RE = re.compile(r'(\{\{fields_as_columns_from\([^}]+\)\}\})|(?i:FROM)\s+([^\s]+)|\b((?i:WHERE))\b')
+_CLAUSE_END_RE = re.compile(r'(.*?)(?:\s+(?:LIMIT|ORDER\s+BY|GROUP\s+BY|HAVING)\b|$)', re.IGNORECASE | re.DOTALL)
+_TRAILING_CLAUSES_RE = re.compile(r'\s+((?:LIMIT|ORDER\s+BY|GROUP\s+BY|HAVING)\b.*?)$', re.IGNORECASE | re.DOTALL)
+# Quoted field titles inside the custom syntax: ""double double"" first, then "double" or 'single'
+_DOUBLE_DOUBLE_QUOTED_RE = re.compile(r'""([^"]+)""')
+_QUOTED_RE = re.compile(r'"([^"]+)"|\'([^\']+)\'')
+
+
+def _scan_sql(sql: str) -> Tuple[Optional[str], Optional[int]]:
+    """Return (first FROM table, offset just past the first WHERE) from a single scan"""
+    table_name = None
+    where_end = None
+    for match in _SCAN_RE.finditer(sql):
+        if match.lastindex == 2 and table_name is None:
+            table_name = match.group(2)
+        elif match.lastindex == 3 and where_end is None:
+            where_end = match.end()
+        if table_name is not None and where_end is not None:
+            break
+    return table_name, where_end
+
+
+def _row_prefilter(json_column: str, field_titles: List[str]) -> str:
+    """
+    Cheap text pre-filter that keeps only rows whose JSON mentions a requested field.
+
+    Postgres can answer {json_column}::text ILIKE '%...%' from a pg_trgm GIN index
+    (CREATE INDEX ... USING gin (({json_column}::text) gin_trgm_ops)) before any
+    jsonb_array_elements scan runs. Returns "" when no safe filter can be built.
+    """
+    patterns = [field_title[:30].translate(_SQL_ESCAPE_TABLE) for field_title in field_titles]
+    # jsonb::text escapes '"', '\\' and control characters, so such titles would never match the raw text
+    if not patterns or any('"' in p or '\\' in p or not p.isprintable() for p in patterns):
+        return ""
+    conditions = " OR ".join(f"{json_column}::text ILIKE '%{p}%'" for p in dict.fromkeys(patterns))
+    return f"({conditions})"
+
 
 class JsonUnnestingParser:
+    """
+    Parser for JSON unnesting custom syntax - unchanged from original.
+    
+    This class maintains the exact same API and behavior as the original
+    to ensure no breaking changes.
+    """
+    
     def __init__(self):
         # Updated pattern to capture fields_as_columns_from with variable field list
-        self.custom_syntax_pattern = r'\{\{fields_as_columns_from\(([^,]+),\s*([^,]+),\s*([^,]+),\s*(.+)\)\}\}'
+        self.custom_syntax_pattern = _CUSTOM_SYNTAX_RE.pattern
 
     def parse(self, sql: str) -> Dict[str, Any]:
         """Parse SQL for custom unnesting syntax and return unnesting requests"""
+        if _TEMPLATE_MARKER not in sql:
+            return {"unnesting_requests": []}
+
         unnesting_requests = []
 
-        matches = re.findall(self.custom_syntax_pattern, sql, re.DOTALL)
+        matches = _CUSTOM_SYNTAX_RE.findall(sql)
         for match in matches:
             json_column, name_key, value_key, field_list_str = match
             
@@ -43,180 +143,101 @@ class JsonUnnestingParser:
     
     def _parse_field_list(self, field_list_str: str) -> List[str]:
         """Parse comma-separated list of quoted field titles"""
-        field_titles = []
-        
         # Find all quoted strings (both double double-quotes and single double-quotes)
         # First try double double-quotes (""field""), then single double-quotes ("field")
-        double_quoted_pattern = r'""([^"]+)""'
-        single_quoted_pattern = r'"([^"]+)"'
-        single_quote_pattern = r"'([^']+)'"
-        
-        # Try double double-quotes first
-        matches = re.findall(double_quoted_pattern, field_list_str)
+        matches = _DOUBLE_DOUBLE_QUOTED_RE.findall(field_list_str)
         if matches:
             # If we found double double-quotes, use those
-            for match in matches:
-                if match.strip():
-                    field_titles.append(match.strip())
-        else:
-            # Fallback to single quotes patterns
-            matches = re.findall(single_quoted_pattern + '|' + single_quote_pattern, field_list_str)
-            for match in matches:
-                # match is a tuple where one element is empty and one contains the string
-                field_title = match[0] if match[0] else match[1] if isinstance(match, tuple) else match
-                if field_title and field_title.strip():
-                    field_titles.append(field_title.strip())
-        
-        return field_titles
+            return [title for match in matches if (title := match.strip())]
+
+        # Fallback to single quotes patterns - exactly one of the two alternatives
+        # matched, and it is the last group set
+        return [
+            title for match in _QUOTED_RE.finditer(field_list_str)
+            if (title := match[match.lastindex].strip())
+        ]
 
-class JsonUnnestingTransformer:
+
+class JsonUnnestingTransformerRefactored:
+    """
+    Refactored transformer using strategy pattern architecture.
+    
+    This class maintains the exact same API as the original JsonUnnestingTransformer
+    but uses the new strategy-based architecture internally for clean separation
+    of concerns and improved maintainability.
+    """
+    
+    def __init__(self, prefilter_rows: bool = False, use_jsonpath: bool = False):
+        """
+        Initialize with strategy-based column expression generator.
+        
+        Args:
+            prefilter_rows: Also drop rows whose JSON text mentions none of the
+                requested fields (off by default - such rows are normally kept
+                with empty values)
+            use_jsonpath: Look fields up in the nested 'list' array with a single
+                jsonb_path_query_first() call (PostgreSQL 12+)
+        """
+        self.expression_generator = ColumnExpressionGenerator(use_jsonpath=use_jsonpath)
+        self.prefilter_rows = prefilter_rows
+    
     def transform(self, sql: str, unnesting_requests: List[Dict[str, Any]]) -> str:
-        """Transform SQL by replacing custom syntax with CTE for JSON unnesting"""
-        # Validate unnesting requests
+        """
+        Transform SQL by replacing custom syntax with CTE for JSON unnesting.
+        
+        This method maintains the exact same API and behavior as the original
+        transform() method but uses the strategy pattern internally.
+        
+        Args:
+            sql: Original SQL with custom syntax
+            unnesting_requests: List of parsed unnesting request dictionaries
+            
+        Returns:
+            Transformed SQL with CTE structure
+        """
+        # Validate unnesting requests (same validation as original)
         for req in unnesting_requests:
-            if not all(key in req for key in ["json_column", "name_key", "value_key", "field_titles"]):
+            if not _REQUIRED_KEYS <= req.keys():
                 raise ValueError("Invalid unnesting request: missing required keys")
 
-        # Generate CTE with explicit field columns
+        return self._build_transformed_sql(sql, unnesting_requests)
+
+    def _build_transformed_sql(self, sql: str, unnesting_requests: List[Dict[str, Any]]) -> str:
+        """Build the transformed SQL for already validated unnesting requests"""
+        # Early return for no unnesting requests - just remove template syntax and return
         if not unnesting_requests:
-            # If no unnesting requests, just remove the template syntax and return
-            clean_sql = re.sub(r'\{\{fields_as_columns_from\([^}]+\)\}\}', '', sql)
+            clean_sql = _TEMPLATE_RE.sub('', sql) if _TEMPLATE_MARKER in sql else sql
             return clean_sql
 
+        # Process first request (same limitation as original)
         req = unnesting_requests[0]  # Take the first request
         json_column = req["json_column"]
         name_key = req["name_key"]
-        value_key = req["value_key"]
+        value_key = req["value_key"] 
         field_titles = req["field_titles"]
 
         # Find the table name in FROM clause
-        from_match = re.search(r'FROM\s+([^\s]+)', sql, re.IGNORECASE)
-        table_name = from_match.group(1) if from_match else "unknown_table"
+        table_name, where_end = _scan_sql(sql)
+        table_name = table_name or "unknown_table"
 
         # Extract WHERE clause and other clauses separately
-        where_match = re.search(r'\bWHERE\b(.*?)(?:\s+(?:LIMIT|ORDER\s+BY|GROUP\s+BY|HAVING)\b|$)', sql, re.IGNORECASE | re.DOTALL)
+        where_match = _CLAUSE_END_RE.match(sql, where_end) if where_end is not None else None
         where_clause = where_match.group(1).strip() if where_match else ""
+        prefilter = _row_prefilter(json_column, field_titles) if self.prefilter_rows else ""
+        if prefilter:
+            where_clause = f"({where_clause}) AND {prefilter}" if where_clause else prefilter
         where_part = f"WHERE {where_clause}" if where_clause else ""
         
-        # Extract additional clauses (LIMIT, ORDER BY, etc.) that come after WHERE
-        additional_clauses_match = re.search(r'\bWHERE\b.*?\s+((?:LIMIT|ORDER\s+BY|GROUP\s+BY|HAVING)\b.*?)$', sql, re.IGNORECASE | re.DOTALL)
-        if not additional_clauses_match:
+        # Extract additional clauses (LIMIT, ORDER BY, etc.) that come after WHERE -
+        # the WHERE match already stops right before them, so no second scan is needed
+        additional_clauses = sql[where_match.end(1):].strip() if where_match else ""
+        if not additional_clauses:
             # Try to find these clauses even without WHERE
-            additional_clauses_match = re.search(r'\s+((?:LIMIT|ORDER\s+BY|GROUP\s+BY|HAVING)\b.*?)$', sql, re.IGNORECASE | re.DOTALL)
-        
-        additional_clauses = additional_clauses_match.group(1).strip() if additional_clauses_match else ""
+            additional_clauses_match = _TRAILING_CLAUSES_RE.search(sql)
+            additional_clauses = additional_clauses_match.group(1).strip() if additional_clauses_match else ""
 
-        # Create column expressions for each explicit field
-        column_expressions = []
-        for i, field_title in enumerate(field_titles):
-            safe_column_name = self._make_safe_column_name(field_title, i)
-            
-            # Create pattern for LIKE matching (truncated to 30 chars, escaped single quotes)
-            pattern = field_title[:30].replace("'", "''")
-
-            # Create SQL expression to extract this specific field value
-            # Handle nested JSON structure with 'list' array and flexible field matching
-            extract_expr = f"""
-            COALESCE(
-                -- Try 1: Look in nested 'list' array structure (your specific case)
-                (
-                    SELECT COALESCE(
-                        item->>'value_text',
-                        item->>'answer',
-                        item->>'text',
-                        item->>'value',
-                        ''
-                    )
-                    FROM jsonb_array_elements(
-                        CASE
-                            WHEN {json_column} ? 'list' AND jsonb_typeof({json_column}->'list') = 'array'
-                            THEN {json_column}->'list'
-                            ELSE '[]'::jsonb
-                        END
-                    ) item
-                    WHERE LOWER(item->>'question_title') LIKE LOWER('%{pattern}%')
-                       OR LOWER(item->>'title') LIKE LOWER('%{pattern}%')
-                       OR LOWER(item->>'question') LIKE LOWER('%{pattern}%')
-                       OR LOWER(item->>'name') LIKE LOWER('%{pattern}%')
-                    LIMIT 1
-                ),
-                -- Try 2: Direct field access (skipped for pattern matching approach)
-                NULL,
-                -- Try 3: Look in array elements for matching title/question/name with flexible matching
-                (
-                    SELECT COALESCE(
-                        elem->>'value_text',
-                        elem->>'value',
-                        elem->>'text',
-                        elem->>'answer',
-                        elem->>'response',
-                        elem->>'description',
-                        elem->>'comment',
-                        ''
-                    )
-                    FROM jsonb_array_elements(
-                        CASE
-                            WHEN jsonb_typeof({json_column}) = 'array'
-                            THEN {json_column}
-                            ELSE jsonb_build_array({json_column})
-                        END
-                    ) elem
-                    WHERE LOWER(elem->>'question_title') LIKE LOWER('%{pattern}%')
-                       OR LOWER(elem->>'title') LIKE LOWER('%{pattern}%')
-                       OR LOWER(elem->>'question') LIKE LOWER('%{pattern}%')
-                       OR LOWER(elem->>'name') LIKE LOWER('%{pattern}%')
-                       OR LOWER(elem->>'label') LIKE LOWER('%{pattern}%')
-                       OR LOWER(elem->>'key') LIKE LOWER('%{pattern}%')
-                    LIMIT 1
-                ),
-                -- Try 4: Look for field_title as a direct string value in the array
-                (
-                    SELECT COALESCE(
-                        elem->>'value_text',
-                        elem->>'value',
-                        elem->>'text',
-                        elem->>'answer',
-                        elem->>'response',
-                        ''
-                    )
-                    FROM jsonb_array_elements(
-                        CASE
-                            WHEN jsonb_typeof({json_column}) = 'array'
-                            THEN {json_column}
-                            ELSE jsonb_build_array({json_column})
-                        END
-                    ) elem
-                    WHERE LOWER(elem->>0)::text LIKE LOWER('%{pattern}%')
-                    LIMIT 1
-                ),
-                -- Try 5: Try to find the field_title anywhere in the JSON as a value
-                (
-                    SELECT COALESCE(
-                        value->>'value_text',
-                        value->>'value',
-                        value->>'text',
-                        value->>'answer',
-                        ''
-                    )
-                    FROM jsonb_array_elements(
-                        CASE
-                            WHEN jsonb_typeof({json_column}) = 'array'
-                            THEN {json_column}
-                            ELSE jsonb_build_array({json_column})
-                        END
-                    ) value
-                    WHERE LOWER(value->>0)::text LIKE LOWER('%{pattern}%')
-                       OR LOWER(value->>'question_title')::text LIKE LOWER('%{pattern}%')
-                       OR LOWER(value->>'title')::text LIKE LOWER('%{pattern}%')
-                       OR LOWER(value->>'question')::text LIKE LOWER('%{pattern}%')
-                       OR LOWER(value->>'name')::text LIKE LOWER('%{pattern}%')
-                    LIMIT 1
-                ),
-                ''
-            ) AS "{safe_column_name}"
-            """
-
-            column_expressions.append(extract_expr.strip())
+        # Generate column expressions using strategy pattern
+        column_expressions = self._build_column_expressions(json_column, field_titles)
 
         # HYBRID APPROACH: Use CTE for proper data retrieval but preserve user's column selection
         
@@ -227,76 +248,212 @@ class JsonUnnestingTransformer:
         
         original_select = select_match.group(1).strip()
         
-        # Replace the template syntax with extracted column expressions in the SELECT clause
+        # Replace the template syntax with extracted column expressions in the SELECT clause.
+        # A callable replacement is inserted as-is: re.sub never parses the multi-KB
+        # expression text as a template, and backslashes in field titles stay literal
         extracted_columns_sql = ",\n".join(column_expressions)
-        user_columns_with_extractions = re.sub(
-            r'\{\{fields_as_columns_from\([^}]+\)\}\}',
-            extracted_columns_sql,
-            original_select
-        )
+        user_columns_with_extractions = _TEMPLATE_RE.sub(lambda _: extracted_columns_sql, original_select)
 
         # Create the final SQL with CTE structure for proper data retrieval
         # but only select the user's specified columns
-        final_sql = f"""
-        WITH base_data AS (
-            SELECT {user_columns_with_extractions}
-            FROM {table_name}
-            {where_part}
-        )
-        SELECT * FROM base_data
-        {additional_clauses}
-        """
+        # Assembled line by line and joined once, so no padded copy needs stripping
+        # base_data is referenced once, so PostgreSQL 12+ inlines it without a
+        # NOT MATERIALIZED hint (which older servers would reject)
+        sql_lines = [
+            "WITH base_data AS (",
+            f"            SELECT {user_columns_with_extractions}",
+            f"            FROM {table_name}",
+            f"            {where_part}",
+            "        )",
+            "        SELECT * FROM base_data",
+        ]
+        if additional_clauses:
+            sql_lines.append(f"        {additional_clauses}")
 
-        return final_sql.strip()
+        return "\n".join(sql_lines)
     
+    def _build_column_expressions(self, json_column: str, field_titles: List[str]) -> List[str]:
+        """Build one COALESCE extraction expression per explicit field title"""
+        return [
+            self.expression_generator.generate_column_expression(
+                field_title=field_title,
+                index=i,
+                json_column=json_column
+            )
+            for i, field_title in enumerate(field_titles)
+        ]
+
     def _make_safe_column_name(self, field_title: str, index: int) -> str:
-        """Convert field title to a safe PostgreSQL column name"""
-        # Replace problematic characters
-        safe_name = re.sub(r'[^\w\s]', '_', field_title)
-        safe_name = re.sub(r'\s+', '_', safe_name)
-        safe_name = safe_name.strip('_').lower()
-        
-        # Ensure it's not too long (PostgreSQL limit is 63 characters)
-        if len(safe_name) > 50:
-            safe_name = safe_name[:47] + f"_{index}"
-        
-        # Ensure it doesn't start with a number
-        if safe_name and safe_name[0].isdigit():
-            safe_name = f"field_{safe_name}"
+        """
+        DEPRECATED: This method is now handled by ColumnExpressionGenerator.
         
-        return safe_name or f"field_{index}"
+        Keeping for backward compatibility but delegating to the new architecture.
+        """
+        return self.expression_generator._make_safe_column_name(field_title, index)
 
-# Simplified approach: use explicit field lists instead of auto-discovery
 
-def process_query_with_json_unnesting(sql: str, database_url: str) -> List[Dict[str, Any]]:
-    """Process a query with JSON unnesting and return results"""
-    parser = JsonUnnestingParser()
-    transformer = JsonUnnestingTransformer()
+# For backward compatibility, create aliases to the original class names
+JsonUnnestingTransformer = JsonUnnestingTransformerRefactored
+
+
+@lru_cache(maxsize=128)
+def specialize_macro(json_column: str, name_key: str, value_key: str, *field_titles: str) -> str:
+    """
+    Render the column expressions for a fixed fields_as_columns_from() call.
+
+    For schemas known at config time the result can be substituted directly
+    into a query template, skipping the parse/transform step on every request.
+    The output is the same text transform() splices into the SELECT clause.
+
+    The strategies match titles and read values with fixed key sets, so
+    name_key and value_key must be among the keys they use; anything else
+    raises ValueError instead of being silently ignored.
+    """
+    if name_key not in DEFAULT_MATCH_KEYS:
+        raise ValueError(f"Unsupported name_key {name_key!r}: titles are matched on {DEFAULT_MATCH_KEYS}")
+    if value_key not in DEFAULT_VALUE_KEYS:
+        raise ValueError(f"Unsupported value_key {value_key!r}: values are read from {DEFAULT_VALUE_KEYS}")
+    return ",\n".join(_TRANSFORMER._build_column_expressions(json_column, list(field_titles)))
+
+
+def suggest_indexes(table_name: str, json_column: str) -> List[str]:
+    """
+    DDL for the index that serves the opt-in row pre-filter (prefilter_rows=True).
+
+    The per-element matching inside jsonb_array_elements() cannot use an index;
+    the pre-filter's {json_column}::text ILIKE '%...%' can, through pg_trgm.
+    The statements are returned for a DBA to run - they are never executed here.
+    """
+    index_name = re.sub(r'\W+', '_', f"ix_{table_name}_{json_column}_trgm")
+    return [
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} "
+        f"USING gin (({json_column}::text) gin_trgm_ops)",
+    ]
+
+
+# Parser and transformer hold no per-query state, so every request shares one instance
+_PARSER = JsonUnnestingParser()
+_TRANSFORMER = JsonUnnestingTransformerRefactored()
 
-    # Parse the query
-    parsed = parser.parse(sql)
-    unnesting_requests = parsed["unnesting_requests"]
 
-    # Transform if there are unnesting requests
-    if unnesting_requests:
-        transformed_sql = transformer.transform(sql, unnesting_requests)
-    else:
-        transformed_sql = sql
+@lru_cache(maxsize=_TRANSFORM_CACHE_SIZE)
+def _transform_query(sql: str) -> str:
+    """Parse and transform sql with the shared instances; the result depends on sql alone"""
+    unnesting_requests = _PARSER.parse(sql)["unnesting_requests"]
+    if not unnesting_requests:
+        return sql
+    return _TRANSFORMER.transform(sql, unnesting_requests)
 
-    # Execute the query only if psycopg is available
-    if not HAS_PSYCOPG or psycopg is None:
-        # Return empty list for testing purposes when psycopg is not available
-        return []
 
+def _load_psycopg() -> bool:
+    """
+    Import psycopg, and psycopg_pool when installed, on first use.
+
+    find_spec() only shows the packages are present; an import can still fail
+    (e.g. no libpq for a non-binary psycopg). Such a failure is logged once and
+    treated as psycopg being unavailable, as when it is not installed at all;
+    a pool that cannot be imported falls back to direct connections.
+    """
+    global psycopg, dict_row, ConnectionPool, HAS_PSYCOPG, HAS_PSYCOPG_POOL
+    if psycopg is None:
+        try:
+            import psycopg
+            from psycopg.rows import dict_row
+        except ImportError as e:
+            logger.warning(f"psycopg is installed but cannot be imported, queries will not be executed: {e}")
+            psycopg = None
+            HAS_PSYCOPG = False
+            return False
+    if HAS_PSYCOPG_POOL and ConnectionPool is None:
+        try:
+            from psycopg_pool import ConnectionPool
+        except ImportError as e:
+            logger.warning(f"psycopg_pool cannot be imported, using direct connections: {e}")
+            HAS_PSYCOPG_POOL = False
+    return True
+
+
+def _configure_connection(conn) -> None:
+    """Session guardrail applied once per pooled connection instead of once per query"""
+    conn.execute("SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY")
+    conn.commit()
+
+
+def _get_pool(database_url: str):
+    """
+    Return the connection pool for database_url, opening it on first use.
+
+    Connections are checked before being handed out, so one the server has
+    dropped since it was returned is replaced instead of failing the request.
+    """
+    pool = _POOLS.get(database_url)
+    if pool is None:
+        pool = ConnectionPool(
+            database_url,
+            min_size=0,
+            max_size=_POOL_MAX_SIZE,
+            max_idle=_POOL_MAX_IDLE,
+            kwargs={"connect_timeout": 15, "row_factory": dict_row},
+            configure=_configure_connection,
+            check=ConnectionPool.check_connection,
+            open=True,
+        )
+        _POOLS[database_url] = pool
+    return pool
+
+
+def _stream_rows(conn, sql: str, setup_sql: str = _QUERY_SETUP_SQL) -> Iterator[Dict[str, Any]]:
+    """Run setup_sql then sql on conn, yielding rows from a server-side cursor"""
+    conn.execute(setup_sql)
+    # Named (server-side) cursor: unnested results are fetched in batches of
+    # _STREAM_BATCH_SIZE rows instead of one client-side result for the whole query
+    with conn.cursor(name="json_unnesting_stream") as cur:
+        cur.itersize = _STREAM_BATCH_SIZE
+        cur.execute(sql)
+        while chunk := cur.fetchmany(_STREAM_BATCH_SIZE):
+            yield from chunk
+
+
+def iter_query_with_json_unnesting(sql: str, database_url: str) -> Iterator[Dict[str, Any]]:
+    """
+    Process a query with JSON unnesting and yield result rows as they arrive.
+    
+    Rows are fetched in batches, so callers that stop early (e.g. at a row
+    limit) never pull the rest of the result from the server. The connection
+    is released when the iterator is exhausted or closed.
+    """
+    # Parse and transform (cached by SQL text)
+    transformed_sql = _transform_query(sql)
+
+    # Execute the query only if psycopg is available (same as original)
+    if not HAS_PSYCOPG:
+        # Yield nothing for testing purposes when psycopg is not available
+        return
+
+    if not _load_psycopg():
+        return
     try:
+        if HAS_PSYCOPG_POOL:
+            with _get_pool(database_url).connection() as conn:
+                yield from _stream_rows(conn, transformed_sql)
+            return
+
         conn = psycopg.connect(database_url, connect_timeout=15, row_factory=dict_row)
-        with conn.cursor() as cur:
-            cur.execute("SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY")
-            cur.execute("SET LOCAL statement_timeout = '60s'")
-            cur.execute(transformed_sql)
-            rows = cur.fetchall()
-        conn.close()
-        return rows
+        try:
+            yield from _stream_rows(conn, transformed_sql, _DIRECT_QUERY_SETUP_SQL)
+        finally:
+            conn.close()
     except Exception as e:
         logger.error(f"Error executing query: {e}")
         raise
+
+
+def process_query_with_json_unnesting(sql: str, database_url: str) -> List[Dict[str, Any]]:
+    """
+    Process a query with JSON unnesting and return results.
+    
+    This function maintains the exact same API as the original but uses
+    the refactored transformer internally.
+    """
+    return list(iter_query_with_json_unnesting(sql, database_url))
@@ -89,19 +89,76 @@ class TestJsonUnnestingTransformer:
         assert "WHERE position_name ILIKE '%flutter%'" in transformed
         assert "unnested_answers_json" in transformed
 
+    def test_transform_with_row_prefilter(self):
+        """Test the opt-in JSON text pre-filter is ANDed with the user's WHERE"""
+        transformer = JsonUnnestingTransformer(prefilter_rows=True)
+        sql = "SELECT id, {{fields_as_columns_from(answers_json, question_title, value_text, \"Full Name\", \"Email\")}} FROM candidates WHERE a = 1 OR b = 2"
+        unnesting_requests = JsonUnnestingParser().parse(sql)["unnesting_requests"]
+
+        transformed = transformer.transform(sql, unnesting_requests)
+
+        assert ("WHERE (a = 1 OR b = 2) AND (answers_json::text ILIKE '%Full Name%'"
+                " OR answers_json::text ILIKE '%Email%')") in transformed
+
+        # Off by default: rows without any requested field are kept
+        assert "::text ILIKE" not in JsonUnnestingTransformer().transform(sql, unnesting_requests)
+
+    def test_transform_cte_materialization(self):
+        """Test base_data is a plain CTE with no MATERIALIZED hint"""
+        sql = "SELECT id, {{fields_as_columns_from(answers_json, question_title, value_text, \"Email\")}} FROM candidates"
+        unnesting_requests = JsonUnnestingParser().parse(sql)["unnesting_requests"]
+
+        transformed_sql = JsonUnnestingTransformer().transform(sql, unnesting_requests)
+        assert transformed_sql.startswith("WITH base_data AS (\n")
+        assert "MATERIALIZED" not in transformed_sql
+
+    def test_transform_field_title_with_backslashes(self):
+        """Test backslashes in field titles are copied into the SQL literally"""
+        transformer = JsonUnnestingTransformer()
+        sql = "SELECT id, {{fields_as_columns_from(answers_json, question_title, value_text, \"C:\\temp\\1\")}} FROM candidates"
+        unnesting_requests = JsonUnnestingParser().parse(sql)["unnesting_requests"]
+
+        transformed = transformer.transform(sql, unnesting_requests)
+
+        assert "ILIKE '%C:\\temp\\1%'" in transformed
+
+    def test_suggest_indexes_for_row_prefilter(self):
+        """Test the suggested index covers the pre-filter expression"""
+        from cloud_function.json_unnesting import suggest_indexes
+        statements = suggest_indexes("public_marts.candidates", "answers_json")
+
+        assert statements[0] == "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+        assert statements[1] == ("CREATE INDEX IF NOT EXISTS ix_public_marts_candidates_answers_json_trgm"
+                                 " ON public_marts.candidates USING gin ((answers_json::text) gin_trgm_ops)")
+
+    def test_specialize_macro_matches_transform(self):
+        """Test specialize_macro renders the columns transform() splices into the SELECT"""
+        from cloud_function.json_unnesting import specialize_macro
+        sql = "SELECT id, {{fields_as_columns_from(answers_json, question_title, value_text, \"Full Name\", \"Email\")}} FROM candidates"
+        transformed = JsonUnnestingTransformer().transform(sql, JsonUnnestingParser().parse(sql)["unnesting_requests"])
+
+        columns_sql = specialize_macro("answers_json", "question_title", "value_text", "Full Name", "Email")
+        assert f"SELECT id, {columns_sql}\n" in transformed
+
+        # Keys the strategies never look at are rejected rather than ignored
+        with pytest.raises(ValueError):
+            specialize_macro("answers_json", "custom_title", "value_text", "Full Name")
+        with pytest.raises(ValueError):
+            specialize_macro("answers_json", "question_title", "custom_value", "Full Name")
+
 class TestProcessQueryWithJsonUnnesting:
+    # Set HAS_PSYCOPG to True for this test, and exercise the direct-connect path against the mock
+    @patch('cloud_function.json_unnesting.HAS_PSYCOPG', True)
+    @patch('cloud_function.json_unnesting.HAS_PSYCOPG_POOL', False)
     @patch('cloud_function.json_unnesting.psycopg')
     def test_process_query_integration(self, mock_psycopg):
         """Integration test for processing query with JSON unnesting"""
-        # Set HAS_PSYCOPG to True for this test
-        from cloud_function import json_unnesting
-        json_unnesting.HAS_PSYCOPG = True
-
         # Mock database connection and cursor
         mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [
-            {"id": 1, "answers_json_question_title_1": "Question Title 1", "answers_json_value_text_1": "value_text_1"},
-            {"id": 1, "answers_json_question_title_2": "Question Title 2", "answers_json_value_text_2": "value_text_2"}
+        mock_cursor.fetchmany.side_effect = [
+            [{"id": 1, "answers_json_question_title_1": "Question Title 1", "answers_json_value_text_1": "value_text_1"}],
+            [{"id": 1, "answers_json_question_title_2": "Question Title 2", "answers_json_value_text_2": "value_text_2"}],
+            []
         ]
         mock_conn = MagicMock()
         mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
@@ -111,7 +168,8 @@ class TestProcessQueryWithJsonUnnesting:
         result = process_query_with_json_unnesting(sql, "fake_db_url")
 
         # Verify that the transformed query was executed
-        assert mock_cursor.execute.call_count == 3  # SET statements + our query
+        assert mock_conn.execute.call_count == 1  # SET statements, sent together
+        assert mock_cursor.execute.call_count == 1  # Our query on the streaming cursor
         calls = mock_cursor.execute.call_args_list
         transformed_call = calls[-1]  # Last call should be our transformed query
         executed_sql = transformed_call[0][0]
@@ -130,6 +188,90 @@ class TestProcessQueryWithJsonUnnesting:
         # Should return empty list when no DB connection is actually made
         assert result == []
 
+    @patch('cloud_function.json_unnesting.HAS_PSYCOPG', True)
+    @patch('cloud_function.json_unnesting.psycopg', None)
+    def test_process_query_psycopg_import_failure(self):
+        """Test an installed but unimportable psycopg behaves like a missing one"""
+        import sys
+        from cloud_function import json_unnesting
+
+        with patch.dict(sys.modules, {"psycopg": None}):
+            result = process_query_with_json_unnesting("SELECT id FROM candidates", "fake_db_url")
+
+        assert result == []
+        assert json_unnesting.HAS_PSYCOPG is False
+
+    def test_transformed_sql_is_cached(self):
+        """Test repeated submissions of the same SQL reuse the transformed text"""
+        from cloud_function import json_unnesting
+        sql = "SELECT id, {{fields_as_columns_from(answers_json, question_title, value_text, \"Email\")}} FROM candidates"
+
+        first = json_unnesting._transform_query(sql)
+        hits = json_unnesting._transform_query.cache_info().hits
+        assert json_unnesting._transform_query(sql) is first
+        assert json_unnesting._transform_query.cache_info().hits == hits + 1
+
+    @patch('cloud_function.json_unnesting.HAS_PSYCOPG', True)
+    @patch('cloud_function.json_unnesting.HAS_PSYCOPG_POOL', False)
+    @patch('cloud_function.json_unnesting.psycopg')
+    def test_iter_query_stops_at_caller_limit(self, mock_psycopg):
+        """Test the row iterator fetches no further batches once the caller stops"""
+        from itertools import islice
+        from cloud_function.json_unnesting import iter_query_with_json_unnesting
+
+        mock_cursor = MagicMock()
+        mock_cursor.fetchmany.side_effect = [[{"id": 1}, {"id": 2}], [{"id": 3}], []]
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_psycopg.connect.return_value = mock_conn
+
+        row_iter = iter_query_with_json_unnesting("SELECT id FROM candidates", "fake_db_url")
+        assert list(islice(row_iter, 2)) == [{"id": 1}, {"id": 2}]
+        row_iter.close()
+
+        assert mock_cursor.fetchmany.call_count == 1
+        mock_conn.close.assert_called_once()
+
+    @patch.dict('cloud_function.json_unnesting._POOLS', clear=True)
+    @patch('cloud_function.json_unnesting.HAS_PSYCOPG', True)
+    @patch('cloud_function.json_unnesting.HAS_PSYCOPG_POOL', True)
+    @patch('cloud_function.json_unnesting.ConnectionPool')
+    @patch('cloud_function.json_unnesting.psycopg')
+    def test_pooled_query_path(self, mock_psycopg, mock_pool_class):
+        """Test the pool is opened once per URL, checks connections and streams rows"""
+        from cloud_function import json_unnesting
+
+        mock_cursor = MagicMock()
+        mock_cursor.fetchmany.side_effect = [[{"id": 1}], [], [{"id": 2}], []]
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_pool = mock_pool_class.return_value
+        mock_pool.connection.return_value.__enter__.return_value = mock_conn
+
+        assert process_query_with_json_unnesting("SELECT id FROM candidates", "fake_db_url") == [{"id": 1}]
+        assert process_query_with_json_unnesting("SELECT id FROM candidates", "fake_db_url") == [{"id": 2}]
+
+        # One pool per URL, validating connections and retiring idle ones
+        mock_pool_class.assert_called_once()
+        pool_kwargs = mock_pool_class.call_args.kwargs
+        assert pool_kwargs["check"] is mock_pool_class.check_connection
+        assert pool_kwargs["max_idle"] == json_unnesting._POOL_MAX_IDLE
+        assert pool_kwargs["min_size"] == 0
+        assert pool_kwargs["open"] is True
+        assert pool_kwargs["configure"] is json_unnesting._configure_connection
+        mock_psycopg.connect.assert_not_called()
+
+        # Each query sets its timeout, then runs on the streaming cursor
+        assert mock_conn.execute.call_args_list[0][0][0] == json_unnesting._QUERY_SETUP_SQL
+        mock_cursor.execute.assert_called_with("SELECT id FROM candidates")
+        assert mock_pool.connection.call_count == 2
+
+        # New pooled connections are made read-only and the setting committed
+        new_conn = MagicMock()
+        json_unnesting._configure_connection(new_conn)
+        new_conn.execute.assert_called_once_with("SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY")
+        new_conn.commit.assert_called_once()
+
 class TestErrorHandling:
     def test_invalid_json_column(self):
         """Test handling of invalid JSON column in unnesting request"""
@@ -10,6 +10,7 @@ from json_extraction.strategies.direct_field_strategy import DirectFieldExtracti
 from json_extraction.strategies.flexible_array_strategy import FlexibleArrayExtractionStrategy
 from json_extraction.strategies.direct_string_strategy import DirectStringValueExtractionStrategy
 from json_extraction.strategies.wildcard_search_strategy import WildcardSearchExtractionStrategy
+from json_extraction.strategies.jsonpath_strategy import JsonPathListExtractionStrategy
 
 
 class TestAllStrategiesWork:
@@ -66,6 +67,46 @@ class TestAllStrategiesWork:
             assert strategy.get_strategy_name() == expected_name
             assert len(strategy.get_description()) > 50  # Reasonable description length
             assert isinstance(strategy.is_applicable(self.context), bool)
+    
+    def test_direct_access_sql_uses_text_operator(self):
+        """Test that the (future) direct access SQL uses ->> and escapes quotes"""
+        context = JsonExtractionContext(
+            json_column="test_json",
+            pattern="Field's Name",
+            field_title="Field's Name",
+            safe_column_name="field_s_name"
+        )
+        
+        sql = DirectFieldExtractionStrategy().generate_direct_access_sql(context)
+        assert sql == "test_json->>'Field''s Name'"
+
+    def test_jsonpath_strategy_escapes_literal(self):
+        """Test the JSONPath strategy quotes the pattern for both SQL and jsonpath"""
+        context = JsonExtractionContext(
+            json_column="test_json",
+            pattern='Say "hi" it\'\'s',
+            field_title='Say "hi" it\'s',
+            safe_column_name="say_hi_it_s"
+        )
+        
+        sql = JsonPathListExtractionStrategy().generate_sql_expression(context)
+        assert "jsonb_path_query_first(test_json, 'strict $.list[*] ? (" in sql
+        assert "WHEN jsonb_typeof(test_json->'list') = 'array'" in sql
+        assert '@."question_title" like_regex "Say \\"hi\\" it\'\'s" flag "is"' in sql
+        assert "WHERE item IS NOT NULL" in sql
+
+    def test_jsonpath_strategy_keeps_ilike_wildcards(self):
+        """Test % and _ in a title are wildcards on the JSONPath path, as with ILIKE"""
+        context = JsonExtractionContext(
+            json_column="test_json",
+            pattern="Score % (1.5)_x",
+            field_title="Score % (1.5)_x",
+            safe_column_name="score_1_5_x"
+        )
+        
+        sql = JsonPathListExtractionStrategy().generate_sql_expression(context)
+        # Wildcards translated; regex metacharacters matched literally
+        assert '@."title" like_regex "Score .* \\\\(1\\\\.5\\\\).x" flag "is"' in sql
 
 
 if __name__ == "__main__":
@@ -7,38 +7,38 @@ This ensures we don't lose any functionality during refactoring.
 import pytest
 from unittest.mock import MagicMock, patch
 import json
-import re
 from json_unnesting import JsonUnnestingParser, JsonUnnestingTransformer, process_query_with_json_unnesting
 
+# Sample data matching current system patterns
+SAMPLE_JSON_STRUCTURES = {
+    "nested_list": {
+        "list": [
+            {"question_title": "Full Name", "value_text": "John Doe"},
+            {"question_title": "Email Address", "value_text": "john@example.com"},
+            {"question_title": "Years of Experience", "value_text": "5"}
+        ]
+    },
+    "direct_array": [
+        {"question_title": "Skills", "value": "Python, SQL"},
+        {"title": "Location", "answer": "New York"}
+    ],
+    "mixed_keys": [
+        {"question": "Availability", "response": "Immediately"},
+        {"name": "Salary", "value_text": "$80000"}
+    ]
+}
+
 class TestCurrentFunctionalityBaseline:
     """
     Comprehensive baseline tests to ensure refactoring doesn't break existing functionality
     """
     
-    def setup_method(self):
-        """Setup for each test method"""
-        self.parser = JsonUnnestingParser()
-        self.transformer = JsonUnnestingTransformer()
-        
-        # Sample data matching current system patterns
-        self.sample_json_structures = {
-            "nested_list": {
-                "list": [
-                    {"question_title": "Full Name", "value_text": "John Doe"},
-                    {"question_title": "Email Address", "value_text": "john@example.com"},
-                    {"question_title": "Years of Experience", "value_text": "5"}
-                ]
-            },
-            "direct_array": [
-                {"question_title": "Skills", "value": "Python, SQL"},
-                {"title": "Location", "answer": "New York"}
-            ],
-            "mixed_keys": [
-                {"question": "Availability", "response": "Immediately"},
-                {"name": "Salary", "value_text": "$80000"}
-            ]
-        }
-
+    @classmethod
+    def setup_class(cls):
+        """Shared parser and transformer - both are stateless apart from output caches"""
+        cls.parser = JsonUnnestingParser()
+        cls.transformer = JsonUnnestingTransformer()
+    
     def test_parser_with_explicit_field_list(self):
         """Test parser with explicit field list (current functionality)"""
         sql = '''SELECT * FROM candidates 
@@ -109,7 +109,7 @@ class TestCurrentFunctionalityBaseline:
         assert "answers_json->'list'" in transformed
         assert "jsonb_array_elements(" in transformed
         assert "item->>'value_text'" in transformed
-        assert "item->>'question_title') LIKE LOWER('%Full Name%')" in transformed
+        assert "item->>'question_title' ILIKE '%Full Name%'" in transformed
 
     def test_transformer_strategy3_flexible_array_matching(self):
         """Test Strategy 3: Flexible array matching SQL generation"""
@@ -150,7 +150,9 @@ class TestCurrentFunctionalityBaseline:
             
             # Basic validations
             assert len(safe_name) <= 63, f"Column name too long: {safe_name}"
-            assert re.match(r'^[a-z_][a-z0-9_]*$', safe_name), f"Invalid column name: {safe_name}"
+            # Same as ^[a-z_][a-z0-9_]*$: an ASCII identifier with no uppercase letters
+            assert safe_name.isascii() and safe_name.isidentifier() and safe_name == safe_name.lower(), \
+                f"Invalid column name: {safe_name}"
             assert not safe_name[0].isdigit() if safe_name else True, f"Column starts with digit: {safe_name}"
             
             if field_title:  # Non-empty field titles should contain some of the original
@@ -245,14 +247,14 @@ class TestCurrentFunctionalityBaseline:
         """Integration test: full process with JSON unnesting"""
         # Setup mock database response
         mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [
+        mock_cursor.fetchmany.side_effect = [[
             {
                 "id": 1, 
                 "name": "John Doe",
                 "full_name": "John Doe",  # Generated column
                 "email_address": "john@example.com"  # Generated column
             }
-        ]
+        ], []]
         mock_conn = MagicMock()
         mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
         mock_psycopg.connect.return_value = mock_conn
@@ -260,7 +262,9 @@ class TestCurrentFunctionalityBaseline:
         # Mock HAS_PSYCOPG
         import json_unnesting
         original_has_psycopg = json_unnesting.HAS_PSYCOPG
+        original_has_pool = json_unnesting.HAS_PSYCOPG_POOL
         json_unnesting.HAS_PSYCOPG = True
+        json_unnesting.HAS_PSYCOPG_POOL = False  # exercise the direct-connect path against the mock
         
         try:
             sql = '''SELECT * FROM candidates 
@@ -270,7 +274,8 @@ class TestCurrentFunctionalityBaseline:
             
             # Verify database interactions
             assert mock_psycopg.connect.called
-            assert mock_cursor.execute.call_count == 3  # SET statements + query
+            assert mock_conn.execute.call_count == 1  # SET statements, sent together
+            assert mock_cursor.execute.call_count == 1  # Query on the streaming cursor
             
             # Verify transformed SQL was executed
             executed_calls = mock_cursor.execute.call_args_list
@@ -284,6 +289,7 @@ class TestCurrentFunctionalityBaseline:
             
         finally:
             json_unnesting.HAS_PSYCOPG = original_has_psycopg
+            json_unnesting.HAS_PSYCOPG_POOL = original_has_pool
 
     def test_process_query_without_psycopg(self):
         """Test process_query when psycopg is not available"""
@@ -9,89 +9,36 @@ of clean, extensible code.
 
 import pytest
 from unittest.mock import MagicMock, patch
-from json_unnesting import JsonUnnestingParser, JsonUnnestingTransformer
+from json_unnesting import JsonUnnestingParser
 from json_unnesting_refactored import JsonUnnestingTransformerRefactored, process_query_with_json_unnesting
 
 
 class TestPhase1FinalIntegration:
     """Final integration tests for Phase 1 refactoring"""
     
-    def test_original_vs_refactored_identical_output(self):
-        """Test that original and refactored produce identical SQL output"""
-        test_cases = [
-            # Basic case
-            {
-                "sql": "SELECT * FROM candidates",
-                "fields": ["Full Name", "Email"]
-            },
-            # With WHERE clause
-            {
-                "sql": "SELECT * FROM users WHERE active = true",
-                "fields": ["First Name", "Last Name", "Phone"]
-            },
-            # Multiple fields
-            {
-                "sql": "SELECT * FROM survey_responses",
-                "fields": ["Q1", "Q2", "Q3", "Q4", "Q5"]
-            },
-            # Special characters
-            {
-                "sql": "SELECT * FROM forms",
-                "fields": ["Field's Name", "Another (Special) Field"]
-            }
-        ]
-        
-        parser = JsonUnnestingParser()
-        original_transformer = JsonUnnestingTransformer()
-        refactored_transformer = JsonUnnestingTransformerRefactored()
-        
-        for case in test_cases:
-            # Create unnesting request
-            unnesting_request = [{
-                "json_column": "data_json",
-                "name_key": "question_title",
-                "value_key": "value_text", 
-                "field_titles": case["fields"]
-            }]
-            
-            # Transform with both versions
-            original_sql = original_transformer.transform(case["sql"], unnesting_request)
-            refactored_sql = refactored_transformer.transform(case["sql"], unnesting_request)
-            
-            # Key structural elements should be identical
-            assert "WITH base_data AS" in original_sql and "WITH base_data AS" in refactored_sql
-            assert "SELECT * FROM base_data" in original_sql and "SELECT * FROM base_data" in refactored_sql
-            
-            # Should have same number of field columns
-            original_as_count = original_sql.count(" AS \"")
-            refactored_as_count = refactored_sql.count(" AS \"")
-            assert original_as_count == refactored_as_count == len(case["fields"])
-            
-            # Core extraction logic should be present in both
-            assert "data_json ? 'list'" in original_sql and "data_json ? 'list'" in refactored_sql
-            assert "COALESCE(" in original_sql and "COALESCE(" in refactored_sql
-    
-    @patch('json_unnesting_refactored.psycopg')
+    @patch('json_unnesting.psycopg')
     def test_full_pipeline_with_refactored_system(self, mock_psycopg):
         """Test complete pipeline using refactored system"""
         # Setup mock database response
         mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [
+        mock_cursor.fetchmany.side_effect = [[
             {
                 "id": 1, 
                 "name": "John Doe",
                 "full_name": "John Doe",
                 "email_address": "john@example.com"
             }
-        ]
+        ], []]
         mock_conn = MagicMock()
         mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
         mock_psycopg.connect.return_value = mock_conn
         
         # Mock HAS_PSYCOPG for refactored module
-        import json_unnesting_refactored
-        original_has_psycopg = json_unnesting_refactored.HAS_PSYCOPG
-        json_unnesting_refactored.HAS_PSYCOPG = True
+        import json_unnesting
+        original_has_psycopg = json_unnesting.HAS_PSYCOPG
+        original_has_pool = json_unnesting.HAS_PSYCOPG_POOL
+        json_unnesting.HAS_PSYCOPG = True
+        json_unnesting.HAS_PSYCOPG_POOL = False  # exercise the direct-connect path against the mock
         
         try:
             sql = '''SELECT * FROM candidates 
@@ -102,14 +49,16 @@ class TestPhase1FinalIntegration:
             
             # Verify database interactions
             assert mock_psycopg.connect.called
-            assert mock_cursor.execute.call_count == 3  # SET statements + query
+            assert mock_conn.execute.call_count == 1  # SET statements, sent together
+            assert mock_cursor.execute.call_count == 1  # Query on the streaming cursor
             
             # Verify results
             assert len(result) == 1
             assert result[0]["id"] == 1
             
         finally:
-            json_unnesting_refactored.HAS_PSYCOPG = original_has_psycopg
+            json_unnesting.HAS_PSYCOPG = original_has_psycopg
+            json_unnesting.HAS_PSYCOPG_POOL = original_has_pool
     
     def test_strategy_extensibility(self):
         """Test that new strategies can be easily added"""
@@ -132,7 +81,7 @@ class TestPhase1FinalIntegration:
         original_count = generator.get_strategy_count()
         
         # Add custom strategy
-        generator.strategies.append(CustomTestStrategy())
+        generator.add_strategy(CustomTestStrategy())
         assert generator.get_strategy_count() == original_count + 1
         
         # Test with applicable context
@@ -141,41 +90,30 @@ class TestPhase1FinalIntegration:
         assert applicable_count > 0  # Should include custom strategy
     
     def test_performance_comparison(self):
-        """Basic performance test - refactored should not be significantly slower"""
+        """Basic performance test - an uncached 20-field transform stays within a fixed budget"""
+        import statistics
         import time
         
-        parser = JsonUnnestingParser()
-        original_transformer = JsonUnnestingTransformer()
-        refactored_transformer = JsonUnnestingTransformerRefactored()
-        
-        sql = "SELECT * FROM large_table"
-        unnesting_request = [{
-            "json_column": "big_json_column",
-            "name_key": "question_title",
-            "value_key": "value_text",
-            "field_titles": [f"Field {i}" for i in range(20)]  # 20 fields
-        }]
-        
-        # Time original transformation
-        start_time = time.time()
-        for _ in range(10):  # 10 iterations
-            original_transformer.transform(sql, unnesting_request)
-        original_time = time.time() - start_time
-        
-        # Time refactored transformation  
-        start_time = time.time()
-        for _ in range(10):  # 10 iterations
-            refactored_transformer.transform(sql, unnesting_request)
-        refactored_time = time.time() - start_time
-        
-        # Refactored should not be more than 5x slower (reasonable overhead for architectural benefits)
-        # Note: Small overhead is expected due to strategy pattern and additional abstractions
-        assert refactored_time < original_time * 5.0
-        print(f"Original: {original_time:.4f}s, Refactored: {refactored_time:.4f}s")
+        field_titles = ", ".join(f'"Field {i}"' for i in range(20))  # 20 fields
+        sql = f"SELECT id, {{{{fields_as_columns_from(big_json_column, question_title, value_text, {field_titles})}}}} FROM large_table"
+        unnesting_request = JsonUnnestingParser().parse(sql)["unnesting_requests"]
+        
+        timings = []
+        for _ in range(50):
+            # A fresh transformer each time, so no generator cache is warm
+            transformer = JsonUnnestingTransformerRefactored()
+            start_ns = time.perf_counter_ns()
+            result = transformer.transform(sql, unnesting_request)
+            timings.append(time.perf_counter_ns() - start_ns)
+        median_ns = statistics.median(timings)
+        
+        assert result.count(' AS "') == 20
+        # Well under a millisecond in practice; the budget only catches gross regressions
+        assert median_ns < 20_000_000
+        print(f"Uncached transform: {median_ns:.0f} ns")
     
     def test_all_baseline_scenarios_still_work(self):
         """Test all baseline scenarios from original test suite still work"""
-        from test_phase1_baseline import TestCurrentFunctionalityBaseline
         
         # Create instance of refactored transformer
         refactored_transformer = JsonUnnestingTransformerRefactored()
@@ -184,7 +122,7 @@ class TestPhase1FinalIntegration:
         test_cases = [
             # Basic transformation
             {
-                "sql": "SELECT * FROM candidates",
+                "sql": "SELECT *, {{fields_as_columns_from(answers_json, question_title, value_text, \"Full Name\")}} FROM candidates",
                 "request": {
                     "json_column": "answers_json",
                     "name_key": "question_title", 
@@ -194,7 +132,7 @@ class TestPhase1FinalIntegration:
             },
             # With WHERE clause
             {
-                "sql": "SELECT * FROM candidates WHERE position = 'Engineer'",
+                "sql": "SELECT *, {{fields_as_columns_from(skills_json, skill_name, skill_level, \"Python\", \"SQL\")}} FROM candidates WHERE position = 'Engineer'",
                 "request": {
                     "json_column": "skills_json",
                     "name_key": "skill_name",
@@ -234,7 +172,7 @@ class TestPhase1ArchitecturalBenefits:
         
         # Can test strategy in complete isolation
         assert "test_json ? 'list'" in sql
-        assert "LOWER('%Test Field%')" in sql
+        assert "ILIKE '%Test Field%'" in sql
         assert strategy.get_strategy_name() == "NestedListExtraction"
         assert strategy.is_applicable(context) is True
     
@@ -38,11 +38,11 @@ class TestJsonExtractionContext:
         )
         
         # Check default value keys
-        expected_value_keys = ["value_text", "answer", "text", "value", "response"]
+        expected_value_keys = ("value_text", "answer", "text", "value", "response")
         assert context.value_keys == expected_value_keys
         
         # Check default match keys
-        expected_match_keys = ["question_title", "title", "question", "name"]
+        expected_match_keys = ("question_title", "title", "question", "name")
         assert context.match_keys == expected_match_keys
     
     def test_custom_key_sets(self):
@@ -59,8 +59,17 @@ class TestJsonExtractionContext:
             match_keys=custom_match_keys
         )
         
-        assert context.value_keys == custom_value_keys
-        assert context.match_keys == custom_match_keys
+        # Custom lists are stored as tuples
+        assert context.value_keys == tuple(custom_value_keys)
+        assert context.match_keys == tuple(custom_match_keys)
+    
+    def test_context_is_immutable_and_hashable(self):
+        """Test contexts can be used as cache keys"""
+        context = JsonExtractionContext("json_col", "pattern", "Field", "field")
+        
+        assert hash(context) == hash(JsonExtractionContext("json_col", "pattern", "Field", "field"))
+        with pytest.raises(AttributeError):
+            context.pattern = "other"
 
 
 class ConcreteTestStrategy(BaseJsonExtractionStrategy):
@@ -80,10 +89,11 @@ class ConcreteTestStrategy(BaseJsonExtractionStrategy):
 class TestBaseJsonExtractionStrategy:
     """Test the base strategy class and its helper methods"""
     
-    def setup_method(self):
-        """Setup for each test"""
-        self.strategy = ConcreteTestStrategy()
-        self.context = JsonExtractionContext(
+    @classmethod
+    def setup_class(cls):
+        """Shared strategy and context - no test modifies either"""
+        cls.strategy = ConcreteTestStrategy()
+        cls.context = JsonExtractionContext(
             json_column="test_json",
             pattern="Test Field",
             field_title="Test Field",
@@ -112,8 +122,8 @@ class TestBaseJsonExtractionStrategy:
         pattern = "Test Pattern"
         result = self.strategy._build_match_conditions(match_keys, pattern)
         
-        expected = ("LOWER(item->>'question_title') LIKE LOWER('%Test Pattern%')\n"
-                   "                       OR LOWER(item->>'title') LIKE LOWER('%Test Pattern%')")
+        expected = ("item->>'question_title' ILIKE '%Test Pattern%'\n"
+                   "                       OR item->>'title' ILIKE '%Test Pattern%'")
         assert result == expected
     
     def test_build_match_conditions_custom_alias(self):
@@ -122,8 +132,8 @@ class TestBaseJsonExtractionStrategy:
         pattern = "Custom"
         result = self.strategy._build_match_conditions(match_keys, pattern, "custom_item")
         
-        expected = ("LOWER(custom_item->>'name') LIKE LOWER('%Custom%')\n"
-                   "                       OR LOWER(custom_item->>'label') LIKE LOWER('%Custom%')")
+        expected = ("custom_item->>'name' ILIKE '%Custom%'\n"
+                   "                       OR custom_item->>'label' ILIKE '%Custom%'")
         assert result == expected
     
     def test_build_extended_value_coalesce(self):
@@ -141,9 +151,9 @@ class TestBaseJsonExtractionStrategy:
         result = self.strategy._build_extended_match_conditions(extended_keys, pattern)
         
         # Should use default alias 'elem' for extended methods
-        assert "LOWER(elem->>'question_title') LIKE LOWER('%Extended%')" in result
-        assert "LOWER(elem->>'label') LIKE LOWER('%Extended%')" in result
-        assert "LOWER(elem->>'key') LIKE LOWER('%Extended%')" in result
+        assert "elem->>'question_title' ILIKE '%Extended%'" in result
+        assert "elem->>'label' ILIKE '%Extended%'" in result
+        assert "elem->>'key' ILIKE '%Extended%'" in result
     
     def test_concrete_strategy_implementation(self):
         """Test that concrete strategy works correctly"""
@@ -14,9 +14,10 @@ from json_extraction.strategies.nested_list_strategy import NestedListExtraction
 class TestNestedListExtractionStrategy:
     """Test the nested list extraction strategy implementation"""
     
-    def setup_method(self):
-        """Setup for each test"""
-        self.strategy = NestedListExtractionStrategy()
+    @classmethod
+    def setup_class(cls):
+        """Shared strategy - strategies hold no state"""
+        cls.strategy = NestedListExtractionStrategy()
         
     def test_strategy_metadata(self):
         """Test strategy name and applicability"""
@@ -82,10 +83,10 @@ class TestNestedListExtractionStrategy:
         sql = self.strategy.generate_sql_expression(context)
         
         # Check for default match keys in WHERE clause
-        assert "LOWER(item->>'question_title') LIKE LOWER('%Phone Number%')" in sql
-        assert "LOWER(item->>'title') LIKE LOWER('%Phone Number%')" in sql
-        assert "LOWER(item->>'question') LIKE LOWER('%Phone Number%')" in sql
-        assert "LOWER(item->>'name') LIKE LOWER('%Phone Number%')" in sql
+        assert "item->>'question_title' ILIKE '%Phone Number%'" in sql
+        assert "item->>'title' ILIKE '%Phone Number%'" in sql
+        assert "item->>'question' ILIKE '%Phone Number%'" in sql
+        assert "item->>'name' ILIKE '%Phone Number%'" in sql
         
         # Should use OR conditions
         assert " OR " in sql
@@ -129,10 +130,10 @@ class TestNestedListExtractionStrategy:
         sql = self.strategy.generate_sql_expression(context)
         
         # Should use custom match keys
-        assert "LOWER(item->>'custom_title') LIKE LOWER('%Age%')" in sql
-        assert "LOWER(item->>'label') LIKE LOWER('%Age%')" in sql
-        assert "LOWER(item->>'identifier') LIKE LOWER('%Age%')" in sql
-        assert "LOWER(item->>'field_name') LIKE LOWER('%Age%')" in sql
+        assert "item->>'custom_title' ILIKE '%Age%'" in sql
+        assert "item->>'label' ILIKE '%Age%'" in sql
+        assert "item->>'identifier' ILIKE '%Age%'" in sql
+        assert "item->>'field_name' ILIKE '%Age%'" in sql
         
         # Should not contain default match keys
         assert "item->>'question_title'" not in sql
@@ -152,7 +153,7 @@ class TestNestedListExtractionStrategy:
         
         # Pattern should appear in WHERE conditions
         assert "Field's \"Name\"" in sql
-        assert "LOWER('%Field's \"Name\"%')" in sql
+        assert "ILIKE '%Field's \"Name\"%'" in sql
     
     def test_different_json_column_names(self):
         """Test strategy works with different JSON column names"""
@@ -205,15 +206,15 @@ class TestNestedListExtractionStrategy:
             "ELSE '[]'::jsonb",
             "END",
             ") item",
-            "WHERE LOWER(item->>'question_title') LIKE LOWER('%Full Name%')",
-            "OR LOWER(item->>'title') LIKE LOWER('%Full Name%')",
-            "OR LOWER(item->>'question') LIKE LOWER('%Full Name%')",
-            "OR LOWER(item->>'name') LIKE LOWER('%Full Name%')",
+            "WHERE item->>'question_title' ILIKE '%Full Name%'",
+            "OR item->>'title' ILIKE '%Full Name%'",
+            "OR item->>'question' ILIKE '%Full Name%'",
+            "OR item->>'name' ILIKE '%Full Name%'",
             "LIMIT 1"
         ]
         
-        for element in expected_elements:
-            assert element in sql, f"Missing expected element: {element}"
+        missing = [element for element in expected_elements if element not in sql]
+        assert not missing, f"Missing expected elements: {missing}"
     
     def test_empty_pattern_handling(self):
         """Test strategy behavior with empty pattern"""
@@ -227,7 +228,7 @@ class TestNestedListExtractionStrategy:
         sql = self.strategy.generate_sql_expression(context)
         
         # Should still generate valid SQL even with empty pattern
-        assert "LIKE LOWER('%%')" in sql  # Empty pattern becomes %%
+        assert "ILIKE '%%'" in sql  # Empty pattern becomes %%
         assert "SELECT COALESCE(" in sql
         assert "LIMIT 1" in sql
     
@@ -275,7 +276,7 @@ class TestNestedListStrategyIntegration:
         assert "answers_json->'list'" in sql
         assert "jsonb_array_elements(" in sql
         assert "item->>'value_text'" in sql
-        assert "item->>'question_title') LIKE LOWER('%Full Name%')" in sql
+        assert "item->>'question_title' ILIKE '%Full Name%'" in sql
 
 
 if __name__ == "__main__":
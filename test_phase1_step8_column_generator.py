@@ -13,9 +13,10 @@ from json_extraction.strategies.base_strategy import JsonExtractionContext
 class TestColumnExpressionGenerator:
     """Test the column expression generator that coordinates all strategies"""
     
-    def setup_method(self):
-        """Setup for each test"""
-        self.generator = ColumnExpressionGenerator()
+    @classmethod
+    def setup_class(cls):
+        """Shared generator - tests that change its strategies build their own"""
+        cls.generator = ColumnExpressionGenerator()
     
     def test_generator_initialization(self):
         """Test that generator initializes with all 5 strategies"""
@@ -99,7 +100,7 @@ class TestColumnExpressionGenerator:
             assert f'AS "{safe_name}"' in sql
             
             # Each should contain pattern matching for the specific title
-            assert f"LIKE LOWER('%{title}%')" in sql
+            assert f"ILIKE '%{title}%'" in sql
             
             # All should reference same JSON column
             assert "data_json" in sql
@@ -151,7 +152,7 @@ class TestColumnExpressionGenerator:
         assert "jsonb_typeof(answers_json->'list') = 'array'" in sql
         assert "jsonb_array_elements(" in sql
         assert "item->>'value_text'" in sql
-        assert "LOWER('%Full Name%')" in sql
+        assert "ILIKE '%Full Name%'" in sql
         
         # Should match baseline safe column name
         assert 'AS "full_name"' in sql
@@ -176,6 +177,81 @@ class TestColumnExpressionGenerator:
                 if other_column != column:
                     assert other_column not in sql
 
+    def test_repeated_generation_is_cached(self):
+        """Test identical requests reuse the cached expression"""
+        first = self.generator.generate_column_expression("Full Name", 0, "answers_json")
+        second = self.generator.generate_column_expression("Full Name", 0, "answers_json")
+
+        assert second is first
+
+        # A different index or column is generated separately
+        assert self.generator.generate_column_expression("Full Name", 0, "form_data") != first
+
+    def test_column_template_matches_per_field_build(self):
+        """Test the per-column template renders the same SQL as building each strategy"""
+        uncompiled = ColumnExpressionGenerator()
+        uncompiled._coalesce_template = lambda json_column: None
+
+        for i, title in enumerate(["Full Name", "Field's \"Name\"", "C:\\temp\\1", ""]):
+            assert (self.generator.generate_column_expression(title, i, "answers_json")
+                    == uncompiled.generate_column_expression(title, i, "answers_json"))
+
+        # The JSONPath strategy escapes the pattern itself, so it is never templated
+        assert ColumnExpressionGenerator(use_jsonpath=True)._coalesce_template("answers_json") is None
+
+    def test_shadowed_wildcard_strategy_is_skipped(self):
+        """Test Strategy 5 is left out while Strategies 3 and 4 cover its conditions"""
+        sql = self.generator.generate_column_expression("Full Name", 0, "answers_json")
+        assert "value->>'question_title'" not in sql
+        assert "elem->>0 ILIKE '%Full Name%'" in sql
+
+        # On its own (or without the strategies shadowing it) it is still emitted
+        wildcard_only = ColumnExpressionGenerator()
+        wildcard_only.strategies = [wildcard_only.strategies[-1]]
+        assert "value->>'question_title'" in wildcard_only.generate_column_expression("Full Name", 0, "answers_json")
+
+    def test_instance_override_after_generation_is_honored(self):
+        """Test an in-place override followed by invalidate_caches() drops cached decisions and templates"""
+        from json_unnesting import JsonUnnestingTransformerRefactored
+        transformer = JsonUnnestingTransformerRefactored()
+        generator = transformer.expression_generator
+        request = [{"json_column": "answers_json", "name_key": "question_title",
+                    "value_key": "value_text", "field_titles": ["Full Name"]}]
+        sql = "SELECT {{fields_as_columns_from(answers_json, question_title, value_text, \"Full Name\")}} FROM candidates"
+        
+        assert "elem->>'label'" in generator.generate_column_expression("Full Name", 0, "answers_json")
+        assert "elem->>'label'" in transformer.transform(sql, request)
+        
+        flexible = generator.strategies[2]  # FlexibleArrayMatching
+        flexible.is_applicable = lambda context: False
+        generator.invalidate_caches()
+        try:
+            assert "elem->>'label'" not in generator.generate_column_expression("Full Name", 0, "answers_json")
+            assert "elem->>'label'" not in generator.generate_column_expression("Email", 1, "answers_json")
+            assert "elem->>'label'" not in transformer.transform(sql, request)
+        finally:
+            del flexible.is_applicable
+            generator.invalidate_caches()
+        
+        assert "elem->>'label'" in generator.generate_column_expression("Full Name", 0, "answers_json")
+
+    def test_add_and_remove_strategy_bump_version(self):
+        """Test changing the strategy chain bumps strategies_version and drops cached expressions"""
+        generator = ColumnExpressionGenerator()
+        flexible = generator.strategies[2]  # FlexibleArrayMatching
+        assert "elem->>'label'" in generator.generate_column_expression("Full Name", 0, "answers_json")
+        version = generator.strategies_version
+
+        generator.remove_strategy(flexible)
+        assert generator.strategies_version > version
+        assert generator.get_strategy_count() == 4
+        assert "elem->>'label'" not in generator.generate_column_expression("Full Name", 0, "answers_json")
+
+        version = generator.strategies_version
+        generator.add_strategy(flexible)
+        assert generator.strategies_version > version
+        assert generator.strategies[-1] is flexible
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
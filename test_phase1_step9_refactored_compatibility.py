@@ -2,8 +2,9 @@
 """
 Tests for Phase 1 Step 9: Refactored JsonUnnestingTransformer
 
-Tests that the refactored version produces identical results to the original.
-This ensures 100% backward compatibility.
+JsonUnnestingTransformer is now an alias of the refactored class, so instead of
+comparing the two names with each other these tests pin the SQL fragments the
+original implementation produced.
 """
 
 import pytest
@@ -12,195 +13,104 @@ from json_unnesting_refactored import JsonUnnestingTransformerRefactored
 
 
 class TestRefactoredCompatibility:
-    """Test that refactored version produces identical results to original"""
-    
-    def setup_method(self):
-        """Setup both original and refactored transformers"""
-        self.original_transformer = JsonUnnestingTransformer()
-        self.refactored_transformer = JsonUnnestingTransformerRefactored()
-        self.parser = JsonUnnestingParser()
-    
+    """Test that the refactored transformer keeps the original SQL output"""
+
+    @classmethod
+    def setup_class(cls):
+        """Setup transformer and parser, shared by all tests"""
+        cls.transformer = JsonUnnestingTransformerRefactored()
+        cls.parser = JsonUnnestingParser()
+
+    def test_original_name_is_refactored_transformer(self):
+        """Test the original class name still resolves to the refactored transformer"""
+        assert JsonUnnestingTransformer is JsonUnnestingTransformerRefactored
+
     def test_basic_transformation_compatibility(self):
-        """Test basic transformation produces identical results"""
-        sql = "SELECT * FROM candidates"
-        unnesting_requests = [{
-            "json_column": "answers_json",
-            "name_key": "question_title",
-            "value_key": "value_text",
-            "field_titles": ["Full Name", "Email Address"]
-        }]
-        
-        original_result = self.original_transformer.transform(sql, unnesting_requests)
-        refactored_result = self.refactored_transformer.transform(sql, unnesting_requests)
-        
-        # Results should be functionally identical
-        # Note: Whitespace formatting might differ slightly, so we normalize
-        original_normalized = self._normalize_sql(original_result)
-        refactored_normalized = self._normalize_sql(refactored_result)
-        
-        # Key elements should be identical
-        assert "WITH base_data AS" in both_results(original_result, refactored_result)
-        assert "SELECT * FROM base_data" in both_results(original_result, refactored_result)
-        assert "answers_json ? 'list'" in both_results(original_result, refactored_result)
-        assert '"full_name"' in both_results(original_result, refactored_result)
-        assert '"email_address"' in both_results(original_result, refactored_result)
-    
+        """Test basic transformation keeps the CTE structure and column names"""
+        sql = 'SELECT id, {{fields_as_columns_from(answers_json, question_title, value_text, "Full Name", "Email Address")}} FROM candidates'
+        result = self.transformer.transform(sql, self.parser.parse(sql)["unnesting_requests"])
+
+        assert result.startswith("WITH base_data AS (")
+        assert result.endswith("SELECT * FROM base_data")
+        assert "WHEN answers_json ? 'list' AND jsonb_typeof(answers_json->'list') = 'array'" in result
+        assert ') AS "full_name"' in result
+        assert ') AS "email_address"' in result
+
     def test_with_where_clause_compatibility(self):
-        """Test WHERE clause preservation is identical"""
-        sql = "SELECT * FROM candidates WHERE position = 'Engineer'"
-        unnesting_requests = [{
-            "json_column": "data_json",
-            "name_key": "question",
-            "value_key": "answer",
-            "field_titles": ["Skills", "Experience"]
-        }]
-        
-        original_result = self.original_transformer.transform(sql, unnesting_requests)
-        refactored_result = self.refactored_transformer.transform(sql, unnesting_requests)
-        
-        # WHERE clause should be preserved identically
-        assert "WHERE position = 'Engineer'" in both_results(original_result, refactored_result)
-        
-        # Core structure should match
-        assert "data_json ? 'list'" in both_results(original_result, refactored_result)
-        assert '"skills"' in both_results(original_result, refactored_result)
-        assert '"experience"' in both_results(original_result, refactored_result)
-    
+        """Test WHERE clause is kept inside base_data"""
+        sql = "SELECT id, {{fields_as_columns_from(data_json, question, answer, \"Skills\", \"Experience\")}} FROM candidates WHERE position = 'Engineer'"
+        result = self.transformer.transform(sql, self.parser.parse(sql)["unnesting_requests"])
+
+        assert "FROM candidates\n            WHERE position = 'Engineer'\n        )" in result
+        assert "data_json ? 'list'" in result
+        assert ') AS "skills"' in result
+        assert ') AS "experience"' in result
+
     def test_safe_column_name_compatibility(self):
-        """Test that safe column name generation is identical"""
+        """Test safe column name generation matches the original rules"""
         test_cases = [
-            ("Full Name", 0),
-            ("Email Address!", 1),
-            ("Years of Experience (required)", 2),
-            ("", 3),
-            ("123StartWithNumber", 4)
+            ("Full Name", 0, "full_name"),
+            ("Email Address!", 1, "email_address"),
+            ("Years of Experience (required)", 2, "years_of_experience__required"),
+            ("", 3, "field_3"),
+            ("123StartWithNumber", 4, "field_123startwithnumber")
         ]
-        
-        for field_title, index in test_cases:
-            original_name = self.original_transformer._make_safe_column_name(field_title, index)
-            refactored_name = self.refactored_transformer._make_safe_column_name(field_title, index)
-            
-            assert original_name == refactored_name, f"Mismatch for '{field_title}': {original_name} != {refactored_name}"
-    
-    def test_empty_field_titles_compatibility(self):
-        """Test behavior with empty field titles is identical"""
-        sql = "SELECT * FROM table"
-        unnesting_requests = [{
-            "json_column": "json_col",
-            "name_key": "key",
-            "value_key": "val",
-            "field_titles": []
-        }]
-        
-        original_result = self.original_transformer.transform(sql, unnesting_requests)
-        refactored_result = self.refactored_transformer.transform(sql, unnesting_requests)
-        
-        # Both should generate CTE structure even with empty fields
-        assert "WITH base_data AS" in both_results(original_result, refactored_result)
-        assert "SELECT *, " in both_results(original_result, refactored_result)
-    
+
+        for field_title, index, expected in test_cases:
+            assert self.transformer._make_safe_column_name(field_title, index) == expected
+
     def test_no_unnesting_requests_compatibility(self):
-        """Test behavior with no unnesting requests is identical"""
-        sql = "SELECT * FROM table"
-        unnesting_requests = []
-        
-        original_result = self.original_transformer.transform(sql, unnesting_requests)
-        refactored_result = self.refactored_transformer.transform(sql, unnesting_requests)
-        
-        # Should return clean SQL without template syntax
-        assert original_result == refactored_result
-        assert original_result.strip() == "SELECT * FROM table"
-    
+        """Test SQL without unnesting requests is returned unchanged"""
+        assert self.transformer.transform("SELECT * FROM table", []).strip() == "SELECT * FROM table"
+
     def test_validation_error_compatibility(self):
-        """Test that validation errors are identical"""
-        sql = "SELECT * FROM table"
-        invalid_request = {"json_column": "col"}  # Missing required keys
-        
-        # Both should raise the same ValueError
-        with pytest.raises(ValueError, match="Invalid unnesting request: missing required keys"):
-            self.original_transformer.transform(sql, [invalid_request])
-        
+        """Test that a request missing keys raises the original ValueError"""
         with pytest.raises(ValueError, match="Invalid unnesting request: missing required keys"):
-            self.refactored_transformer.transform(sql, [invalid_request])
-    
+            self.transformer.transform("SELECT * FROM table", [{"json_column": "col"}])
+
     def test_multiple_fields_compatibility(self):
-        """Test multiple field processing is identical"""
-        sql = "SELECT * FROM survey"
-        unnesting_requests = [{
-            "json_column": "responses",
-            "name_key": "question_title",
-            "value_key": "value_text",
-            "field_titles": ["Name", "Age", "Email", "Phone", "Comments"]
-        }]
-        
-        original_result = self.original_transformer.transform(sql, unnesting_requests)
-        refactored_result = self.refactored_transformer.transform(sql, unnesting_requests)
-        
-        # All field columns should be present in both
+        """Test every field gets its own column, in order"""
+        sql = 'SELECT id, {{fields_as_columns_from(responses, question_title, value_text, "Name", "Age", "Email", "Phone", "Comments")}} FROM survey'
+        result = self.transformer.transform(sql, self.parser.parse(sql)["unnesting_requests"])
+
         expected_columns = ['"name"', '"age"', '"email"', '"phone"', '"comments"']
-        for col in expected_columns:
-            assert col in both_results(original_result, refactored_result)
-        
-        # Should have same number of COALESCE expressions (one per field + inner ones)
-        original_coalesce_count = original_result.count("COALESCE(")
-        refactored_coalesce_count = refactored_result.count("COALESCE(")
-        assert original_coalesce_count == refactored_coalesce_count
-    
+        positions = [result.index(f") AS {col}") for col in expected_columns]
+        assert positions == sorted(positions)
+        assert result.count(' AS "') == len(expected_columns)
+
     def test_special_characters_compatibility(self):
-        """Test handling of special characters is identical"""
-        sql = "SELECT * FROM data"
+        """Test quotes in field titles are escaped in the ILIKE patterns"""
+        sql = "SELECT id, {{fields_as_columns_from(fields, title, value, \"Special\")}} FROM data"
         unnesting_requests = [{
             "json_column": "fields",
             "name_key": "title",
             "value_key": "value",
             "field_titles": ["Field's \"Name\"", "Another (Special) Field"]
         }]
-        
-        original_result = self.original_transformer.transform(sql, unnesting_requests)
-        refactored_result = self.refactored_transformer.transform(sql, unnesting_requests)
-        
-        # Pattern handling should be identical
-        assert "Field's \"Name\"" in both_results(original_result, refactored_result)
-        assert "Another (Special) Field" in both_results(original_result, refactored_result)
-    
-    def _normalize_sql(self, sql: str) -> str:
-        """Normalize SQL for comparison by removing extra whitespace"""
-        import re
-        # Remove extra whitespace but preserve structure
-        normalized = re.sub(r'\s+', ' ', sql.strip())
-        return normalized
-
-
-def both_results(original: str, refactored: str) -> str:
-    """Helper to check that a substring exists in both results"""
-    # This is a helper for readability in assertions
-    # We'll check each assertion separately, this is just for documentation
-    return original  # Placeholder - actual assertions check both
+        result = self.transformer.transform(sql, unnesting_requests)
+
+        assert "ILIKE '%Field''s \"Name\"%'" in result
+        assert "ILIKE '%Another (Special) Field%'" in result
+        assert ') AS "field_s__name"' in result
+        assert ') AS "another__special__field"' in result
 
 
 class TestRefactoredIntegration:
     """Integration tests for the refactored system"""
-    
+
     def test_full_pipeline_compatibility(self):
-        """Test that full parser -> transformer pipeline works identically"""
-        sql = '''SELECT * FROM candidates 
-                {{fields_as_columns_from(answers_json, question_title, value_text, "Full Name", "Email")}}'''
-        
-        # Use same parser for both (parser unchanged)
-        parser = JsonUnnestingParser()
-        parsed = parser.parse(sql)
-        
-        original_transformer = JsonUnnestingTransformer()
-        refactored_transformer = JsonUnnestingTransformerRefactored()
-        
-        original_result = original_transformer.transform(sql, parsed["unnesting_requests"])
-        refactored_result = refactored_transformer.transform(sql, parsed["unnesting_requests"])
-        
-        # Key structural elements should match
-        assert "WITH base_data AS" in both_results(original_result, refactored_result)
-        assert "answers_json ? 'list'" in both_results(original_result, refactored_result)
-        assert '"full_name"' in both_results(original_result, refactored_result)
-        assert '"email"' in both_results(original_result, refactored_result)
+        """Test the parser -> transformer pipeline produces the expected columns"""
+        sql = '''SELECT id, {{fields_as_columns_from(answers_json, question_title, value_text, "Full Name", "Email")}}
+                FROM candidates'''
+
+        parsed = JsonUnnestingParser().parse(sql)
+        result = JsonUnnestingTransformerRefactored().transform(sql, parsed["unnesting_requests"])
+
+        assert "WITH base_data AS" in result
+        assert "answers_json ? 'list'" in result
+        assert ') AS "full_name"' in result
+        assert ') AS "email"' in result
+        assert "{{" not in result
 
 
 if __name__ == "__main__":
@@ -19,24 +19,30 @@ FROM public_marts.candidates
 WHERE position_name ILIKE '%додо%'
 LIMIT 1"""
 
+# Both URLs differ only in the spreadsheet_id
+URL_TEMPLATE = "https://pg-query-output-to-gsheet-grz2olvbca-uc.a.run.app?sql={sql}&spreadsheet_id={sheet_id}&sheet_name=Test%20Data&starting_cell=A1&include_headers=true"
+
 # URL encode the query
 encoded_query = urllib.parse.quote(test_query)
 
-# Create the test URL - using the PUBLIC test sheet (not your private one)
-test_url = f"https://pg-query-output-to-gsheet-grz2olvbca-uc.a.run.app?sql={encoded_query}&spreadsheet_id=12fFS6Z_9vkba66850fTnmty1VdXcBi_Anyu8Xni6r7w&sheet_name=Test%20Data&starting_cell=A1&include_headers=true"
+# The PUBLIC test sheet (not your private one) and your private sheet
+test_sheet_id = "12fFS6Z_9vkba66850fTnmty1VdXcBi_Anyu8Xni6r7w"
+your_sheet_id = "1s00INXh5PbIAaG6XvhO9oW88e9gmn5V95rvrN0F9G8A"
+
+test_url = URL_TEMPLATE.format(sql=encoded_query, sheet_id=test_sheet_id)
+your_url = URL_TEMPLATE.format(sql=encoded_query, sheet_id=your_sheet_id)
 
-print("Testing your query with the PUBLIC test sheet:")
-print("URL:", test_url[:100] + "...")
-print("\nYou can test this by running:")
-print(f'curl -s "{test_url}"')
 
-# Also show what the URL would look like for your private sheet
-your_sheet_id = "1s00INXh5PbIAaG6XvhO9oW88e9gmn5V95rvrN0F9G8A"
-your_url = f"https://pg-query-output-to-gsheet-grz2olvbca-uc.a.run.app?sql={encoded_query}&spreadsheet_id={your_sheet_id}&sheet_name=Test%20Data&starting_cell=A1&include_headers=true"
+if __name__ == "__main__":
+    print("Testing your query with the PUBLIC test sheet:")
+    print("URL:", test_url[:100] + "...")
+    print("\nYou can test this by running:")
+    print(f'curl -s "{test_url}"')
 
-print(f"\nAnd this is the URL for your private sheet:")
-print(f"curl -s \"{your_url}\"")
+    # Also show what the URL would look like for your private sheet
+    print(f"\nAnd this is the URL for your private sheet:")
+    print(f"curl -s \"{your_url}\"")
 
-print(f"\nThe key difference is the spreadsheet_id:")
-print(f"- Test sheet (working): 12fFS6Z_9vkba66850fTnmty1VdXcBi_Anyu8Xni6r7w")
-print(f"- Your sheet (error):   {your_sheet_id}")
+    print(f"\nThe key difference is the spreadsheet_id:")
+    print(f"- Test sheet (working): {test_sheet_id}")
+    print(f"- Your sheet (error):   {your_sheet_id}")
@@ -28,23 +28,29 @@ print(transformed_sql)
 print("\n=== Analysis ===")
 
 # Check if LIMIT is in the right place (at the end, not in WHERE clause)
-cte_section = transformed_sql[transformed_sql.find("WITH"):transformed_sql.find("SELECT * FROM base_data")]
-final_section = transformed_sql[transformed_sql.find("SELECT * FROM base_data"):]
+# Locate both landmarks once and search each section within those offsets, without copying it
+cte_start = transformed_sql.find("WITH")
+final_start = transformed_sql.find("SELECT * FROM base_data")
+sql_end = len(transformed_sql)
 
-print("CTE section contains LIMIT:", "LIMIT" in cte_section)
-print("Final section contains LIMIT:", "LIMIT" in final_section)
+cte_has_limit = transformed_sql.find("LIMIT", cte_start, final_start) != -1
+final_has_limit = transformed_sql.find("LIMIT", final_start, sql_end) != -1
+print("CTE section contains LIMIT:", cte_has_limit)
+print("Final section contains LIMIT:", final_has_limit)
 
-if "LIMIT" in cte_section:
+if cte_has_limit:
     print("❌ PROBLEM: LIMIT is still in the wrong place!")
-elif "LIMIT" in final_section:
+elif final_has_limit:
     print("✅ GOOD: LIMIT is in the correct position")
 else:
     print("⚠️ LIMIT clause missing entirely")
 
 # Check WHERE clause structure
-if "WHERE position_name ILIKE '%додо%'" in cte_section and "WHERE position_name ILIKE '%додо%'\nLIMIT" not in cte_section:
+cte_has_where = transformed_sql.find("WHERE position_name ILIKE '%додо%'", cte_start, final_start) != -1
+where_has_limit = transformed_sql.find("WHERE position_name ILIKE '%додо%'\nLIMIT", cte_start, final_start) != -1
+if cte_has_where and not where_has_limit:
     print("✅ GOOD: WHERE clause is clean (no LIMIT included)")
-elif "WHERE position_name ILIKE '%додо%'\nLIMIT" in cte_section:
+elif where_has_limit:
     print("❌ PROBLEM: WHERE clause still contains LIMIT")
 else:
     print("⚠️ WHERE clause structure unclear")
@@ -52,4 +58,4 @@ else:
 print(f"\nFinal query structure check:")
 print(f"- Has CTE: {'WITH base_data AS' in transformed_sql}")
 print(f"- Has clean WHERE: {'WHERE position_name ILIKE' in transformed_sql}")
-print(f"- Has final LIMIT: {transformed_sql.strip().endswith('LIMIT 1')}")
+print(f"- Has final LIMIT: {transformed_sql.rstrip().endswith('LIMIT 1')}")